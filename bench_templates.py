@@ -0,0 +1,139 @@
+"""
+RaceCentral 2.0 - Template Render Benchmark
+Times compiling, loading from the bytecode cache and rendering each page
+template, using the last snapshot's races (or a synthetic three-season
+calendar when there is no snapshot).
+
+Usage:
+    python -m bench_templates                  # 200 renders per template
+    python -m bench_templates --iterations 1000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from jinja2 import Environment
+
+from main import (
+    RACE_SEASONS,
+    RACE_SERIES,
+    SNAPSHOT_PATH,
+    precompile_templates,
+    templates,
+)
+from race_index import RaceIndex
+from snapshot import load_snapshot
+from utils import generate_partition_key, generate_row_key
+
+
+def synthetic_events() -> list[dict]:
+    """A full calendar's worth of races: every series, every season, one race a week."""
+    events = []
+    for season in RACE_SEASONS:
+        for offset, series in enumerate(RACE_SERIES):
+            for week in range(24):
+                start = datetime(season, 3, 1, 15 + offset, tzinfo=timezone.utc) + timedelta(weeks=week)
+                start_time = start.strftime("%Y-%m-%dT%H:%M:%SZ")
+                events.append({
+                    "PartitionKey": generate_partition_key(series, start_time),
+                    "RowKey": generate_row_key(start_time, series, f"Race{week}"),
+                    "Series": series,
+                    "RaceName": f"{series} Grand Prix {week + 1}",
+                    "Venue": "Circuit of the Americas",
+                    "Country": "USA",
+                    "StartTime": start_time,
+                    "Network": "ESPN",
+                    "Latitude": 30.13,
+                    "Longitude": -97.64,
+                    "Odds_Data": "Verstappen +150",
+                    "Polymarket_Prob": "42%",
+                    "Winner": "Driver A" if start < datetime.now(timezone.utc) else "",
+                    "Podium2": "Driver B",
+                    "Podium3": "Driver C",
+                })
+    return events
+
+
+def build_contexts(snapshot: dict) -> dict[str, dict]:
+    """Render contexts shaped like the ones the routes pass, per template."""
+    index = RaceIndex(snapshot.get("events") or synthetic_events())
+    now = datetime.now(timezone.utc)
+    upcoming = index.upcoming(now, now + timedelta(days=7))[:20] or index.all()[:20]
+    months = index.months()
+
+    return {
+        "index.html": {
+            "request": None,
+            "upcoming_races": upcoming,
+            "past_races": index.past(now, limit=3),
+            "news": snapshot.get("news", []),
+            "f1_standings": snapshot.get("standings", {}),
+            "series_list": RACE_SERIES,
+            "current_filter": "all",
+        },
+        "calendar.html": {
+            "request": None,
+            "months": months,
+            "selected_year": "all",
+            "selected_series": "all",
+            "years": RACE_SEASONS,
+            "series_list": RACE_SERIES,
+            "total_races": len(index),
+            "current_month_key": now.strftime("%Y-%m"),
+        },
+        "partials/race_card.html": {"request": None, "races": upcoming},
+        "partials/past_races.html": {
+            "request": None,
+            "races": index.past(now, limit=12),
+            "cursor": None,
+            "next_cursor": None,
+            "limit": 12,
+        },
+    }
+
+
+def time_ms(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark(iterations: int, contexts: dict[str, dict]) -> None:
+    env = templates.env
+    cold_env = Environment(loader=env.loader, autoescape=True)
+    cold_env.filters.update(env.filters)
+    cached_env = Environment(loader=env.loader, autoescape=True, bytecode_cache=env.bytecode_cache)
+    cached_env.filters.update(env.filters)
+
+    print(f"{'template':<28}{'compile':>10}{'bytecode':>10}{'mean':>10}{'p50':>10}{'p95':>10}{'KB':>8}")
+    for name, context in contexts.items():
+        compile_ms = time_ms(lambda: cold_env.get_template(name))
+        load_ms = time_ms(lambda: cached_env.get_template(name))
+
+        template = env.get_template(name)
+        html = template.render(context)
+        renders = sorted(time_ms(lambda: template.render(context)) for _ in range(iterations))
+
+        print(
+            f"{name:<28}{compile_ms:>10.2f}{load_ms:>10.2f}"
+            f"{statistics.mean(renders):>10.2f}{renders[len(renders) // 2]:>10.2f}"
+            f"{renders[int(len(renders) * 0.95)]:>10.2f}{len(html.encode()) / 1024:>8.1f}"
+        )
+    print("(times in ms; 'bytecode' is a fresh load from the on-disk cache)")
+
+
+async def main(args: argparse.Namespace) -> None:
+    precompile_templates()
+    snapshot = await load_snapshot(args.snapshot) or {}
+    contexts = build_contexts(snapshot)
+    benchmark(args.iterations, contexts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark template compile and render times")
+    parser.add_argument("--iterations", type=int, default=200, help="renders per template")
+    parser.add_argument("--snapshot", default=SNAPSHOT_PATH, help="snapshot to take races from")
+    asyncio.run(main(parser.parse_args()))
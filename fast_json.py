@@ -0,0 +1,19 @@
+"""
+RaceCentral 2.0 - JSON Encoding
+Compact JSON bytes for API responses, using orjson when it's installed and
+falling back to the standard library otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """Serialize `obj` to compact JSON bytes; unknown types (datetimes) become strings."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
@@ -0,0 +1,182 @@
+"""
+RaceCentral 2.0 - Leader Election
+Picks exactly one process to run the background jobs when uvicorn runs
+several workers (or the app runs on several hosts). Every other worker only
+serves requests and follows the leader's data updates.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import socket
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows - the file lock then always wins
+    fcntl = None
+
+from storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+# Storage entity used for the lease and the data version marker
+META_PARTITION = "Meta"
+LEADER_LEASE_KEY = "Leader"
+
+
+def process_id() -> str:
+    """Unique name for this process, stored as the lease owner."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLock(ABC):
+    """Non-blocking lock: acquire() takes it or renews it, and says whether we hold it."""
+
+    # How long a successful acquire() stays valid without renewal (None: until released)
+    lease_seconds: Optional[float] = None
+
+    @abstractmethod
+    async def acquire(self) -> bool:
+        """Take or renew the lock; True if this process holds it."""
+
+    @abstractmethod
+    async def release(self) -> None:
+        """Give the lock up if this process holds it."""
+
+
+class NoLeaderLock(LeaderLock):
+    """Always held - for a single worker, or when jobs run elsewhere."""
+
+    async def acquire(self) -> bool:
+        return True
+
+    async def release(self) -> None:
+        pass
+
+
+class FileLeaderLock(LeaderLock):
+    """
+    flock() on a local file - for several workers on one host. The OS drops
+    the lock when the process dies, so there's nothing to expire.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    async def acquire(self) -> bool:
+        if self._file is not None:
+            return True
+        if fcntl is None:
+            return True
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lock_file = open(self.path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    async def release(self) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class StorageLeaseLock(LeaderLock):
+    """
+    Lease entity in the shared storage backend - for workers spread over
+    several hosts. The holder renews it well before it expires; if the
+    holder dies, another process takes over once the lease runs out.
+    """
+
+    def __init__(self, get_storage: Callable, owner: str, duration_seconds: float = 60):
+        self._get_storage = get_storage
+        self.owner = owner
+        self.duration_seconds = duration_seconds
+        self.lease_seconds = duration_seconds
+
+    async def acquire(self) -> bool:
+        storage: Optional[StorageBackend] = await self._get_storage()
+        if storage is None:
+            return False
+        return await storage.acquire_lease(META_PARTITION, LEADER_LEASE_KEY, self.owner, self.duration_seconds)
+
+    async def release(self) -> None:
+        storage: Optional[StorageBackend] = await self._get_storage()
+        if storage is not None:
+            await storage.release_lease(META_PARTITION, LEADER_LEASE_KEY, self.owner)
+
+
+class LeaderElection:
+    """
+    Keeps trying to take (or renew) the lock every `interval_seconds`, and
+    calls `on_elected` / `on_demoted` when this process gains or loses it.
+
+    A renewal that errors (a storage hiccup) doesn't demote the leader while
+    its lease is still valid; it steps down only once the lease could expire
+    before the next check, so another process can't have taken over yet.
+    """
+
+    def __init__(
+        self,
+        lock: LeaderLock,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        interval_seconds: float = 20,
+    ):
+        self.lock = lock
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self.interval_seconds = interval_seconds
+        self.is_leader = False
+        self._held_until = 0.0
+
+    async def check(self) -> bool:
+        """One election round; returns whether this process is the leader."""
+        attempted_at = time.monotonic()
+        try:
+            held = await self.lock.acquire()
+            if held:
+                lease = self.lock.lease_seconds
+                self._held_until = attempted_at + lease if lease is not None else math.inf
+        except Exception as e:
+            # Keep a lease that can't lapse before the next renewal attempt
+            held = self.is_leader and time.monotonic() + self.interval_seconds < self._held_until
+            suffix = " - keeping leadership while the lease is valid" if held else ""
+            logger.error(f"Leader lock check failed: {e}{suffix}")
+
+        if held and not self.is_leader:
+            self.is_leader = True
+            logger.info(f"Elected leader (pid {os.getpid()}) - running background jobs")
+            self._on_elected()
+        elif not held and self.is_leader:
+            self.is_leader = False
+            logger.warning(f"Lost leadership (pid {os.getpid()}) - no longer scheduling background jobs")
+            self._on_demoted()
+        return self.is_leader
+
+    async def run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def resign(self) -> None:
+        if self.is_leader:
+            self.is_leader = False
+            self._on_demoted()
+        try:
+            await self.lock.release()
+        except Exception as e:
+            logger.error(f"Failed to release leader lock: {e}")
@@ -0,0 +1,58 @@
+"""
+RaceCentral 2.0 - Live Update Broadcaster
+Fans small per-race updates (odds, results, LIVE status) out to every
+connected Server-Sent Events client.
+"""
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(event: str, data: str) -> str:
+    """Encode one Server-Sent Event; multi-line data becomes one data: line per line."""
+    payload = "\n".join(f"data: {line}" for line in data.splitlines() or [""])
+    return f"event: {event}\n{payload}\n\n"
+
+
+class LiveUpdateBroadcaster:
+    """
+    In-process pub/sub for SSE clients.
+
+    Every subscriber gets its own bounded queue of encoded messages. A client
+    that stops reading has messages dropped rather than holding up the
+    worker that publishes - it catches up on its next page load.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        """Register a queue for the duration of one SSE connection."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: str) -> int:
+        """Queue an event for every subscriber; returns how many received it."""
+        message = format_sse(event, data)
+        delivered = 0
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+                delivered += 1
+            except asyncio.QueueFull:
+                logger.debug(f"Dropped SSE event {event} for a slow client")
+        return delivered
@@ -1,12 +1,16 @@
 """
 RaceCentral 2.0 - Main Application
-A modern, dynamic racing calendar app with FastAPI, Azure Table Storage, and HTMX.
+A modern, dynamic racing calendar app with FastAPI, Azure Table Storage (or SQLite), and HTMX.
 """
 
 import asyncio
+import hashlib
+import io
 import json
 import os
 import logging
+import time
+import uuid
 from datetime import datetime, timezone, timedelta
 from contextlib import asynccontextmanager
 from typing import Optional
@@ -16,25 +20,69 @@ import httpx
 import feedparser
 import fastf1
 from dotenv import load_dotenv
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.gzip import GZipResponder
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from azure.data.tables.aio import TableServiceClient as AsyncTableServiceClient
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from azure.data.tables import UpdateMode, TableTransactionError
 from ics import Calendar, Event
 
+# Load environment variables before importing metrics: prometheus_client picks
+# single- or multi-process mode from PROMETHEUS_MULTIPROC_DIR when it's imported
+load_dotenv()
+
 from utils import (
     get_track_info,
     get_series_logo,
     get_series_color,
-    format_race_time,
     generate_row_key,
+    generate_partition_key,
+    row_key_range,
     RSS_FEEDS,
     TRACK_DATA,
 )
+import fast_json
+from leader import (
+    META_PARTITION,
+    FileLeaderLock,
+    LeaderElection,
+    LeaderLock,
+    NoLeaderLock,
+    StorageLeaseLock,
+    process_id,
+)
+from live_updates import LiveUpdateBroadcaster
+from metrics import (
+    STORAGE_WRITES,
+    SYNC_CHANGES,
+    RequestMetricsMiddleware,
+    external_call,
+    record_cache,
+    record_external_error,
+    record_job_error,
+    render_metrics,
+    track_job,
+)
 from odds_scraper import scrape_draftkings_odds, format_odds_for_display
-
-# Load environment variables
-load_dotenv()
+from race_index import RaceIndex
+from race_store import RaceEventStore
+from response_cache import (
+    COMPRESS_MIN_SIZE,
+    BrotliWriter,
+    CachedResponse,
+    ResponseCache,
+    choose_encoding,
+    etag_matches,
+    http_date,
+    not_modified_since,
+)
+from scheduler import RESULTS_DELAY, RaceJobScheduler
+from snapshot import load_snapshot, save_snapshot
+from storage import StorageBackend, create_storage_backend
+from storage_pipeline import StorageWritePipeline
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -46,13 +94,71 @@ logger = logging.getLogger(__name__)
 
 AZURE_STORAGE_CONNECTION_STRING = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "")
 TABLE_NAME = "RaceEvents"
-PARTITION_KEY = "Season_2025"
+
+# "azure" or "sqlite" - defaults to the embedded SQLite database when Azure isn't configured
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "azure" if AZURE_STORAGE_CONNECTION_STRING else "sqlite")
+SQLITE_DB_PATH = os.getenv("SQLITE_DB_PATH", "data/racecentral.db")
 DATA_SYNC_INTERVAL_HOURS = 24
 
+# Race events are partitioned per series and season, e.g. "F1_2025"
+RACE_SERIES = ["F1", "NASCAR", "IndyCar"]
+RACE_SEASONS = [2024, 2025, 2026]
+
+# Single partition used before the series/season layout (see migrate_partitions.py)
+LEGACY_PARTITION_KEY = "Season_2025"
+
+# Transactions are limited to 100 operations in one partition (Azure Table limit)
+TABLE_BATCH_SIZE = 100
+TABLE_BATCH_RETRIES = 2
+# Delay before the first retry of a failed batch, doubled for each further attempt
+TABLE_BATCH_RETRY_DELAY_SECONDS = 1.0
+
+# "reconcile" writes only changed rows; "replace" deletes and rewrites every series
+SYNC_MODE = os.getenv("SYNC_MODE", "reconcile")
+
+# Maximum number of storage writes in flight at once
+STORAGE_WRITE_CONCURRENCY = int(os.getenv("STORAGE_WRITE_CONCURRENCY", "8"))
+
+# Fields written by the odds job - the schedule sync must not reset them
+ODDS_FIELDS = ("Odds_Data", "Polymarket_Prob")
+RESULT_FIELDS = ("Winner", "Podium2", "Podium3")
+
 # News cache (in-memory)
 news_cache: dict = {"data": [], "timestamp": None}
 NEWS_CACHE_TTL_MINUTES = 15
 
+# Race event cache (in-memory, swapped after each sync)
+race_store = RaceEventStore()
+
+# Server-Sent Events fan-out of per-race changes to open pages
+live_updates = LiveUpdateBroadcaster()
+
+# Rendered HTML cache, keyed by route, query params, data version and the
+# race window shown. Pages carry no clock-dependent text (countdowns and LIVE
+# badges are computed in the browser), so entries can live until the next sync.
+RENDER_CACHE_TTL_SECONDS = int(os.getenv("RENDER_CACHE_TTL_SECONDS", "86400"))
+render_cache = ResponseCache(ttl_seconds=RENDER_CACHE_TTL_SECONDS)
+
+# Last-known-good snapshot on disk, written after each successful sync
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "data/snapshot.json.gz")
+last_snapshot: dict = {"data": None}
+
+# Shared write pipeline for sync and odds jobs
+write_pipeline = StorageWritePipeline(concurrency=STORAGE_WRITE_CONCURRENCY)
+
+# Set to "false" when the jobs run in a separate `python -m worker` process;
+# the web process then only serves pages and follows the worker's data updates
+RUN_BACKGROUND_JOBS = os.getenv("RUN_BACKGROUND_JOBS", "true").lower() == "true"
+
+# Only one process runs the background jobs: "file" (flock, workers on one host),
+# "storage" (lease entity, replicas on several hosts) or "none" (always run them)
+LEADER_LOCK = os.getenv("LEADER_LOCK", "storage" if STORAGE_BACKEND == "azure" else "file")
+LEADER_LOCK_PATH = os.getenv("LEADER_LOCK_PATH", "data/leader.lock")
+LEADER_LEASE_SECONDS = 60
+
+# How often non-leader workers check storage for data the leader has synced
+DATA_VERSION_POLL_SECONDS = int(os.getenv("DATA_VERSION_POLL_SECONDS", "30"))
+
 # =============================================================================
 # FASTF1 INTEGRATION (Dynamic F1 Schedule)
 # =============================================================================
@@ -98,7 +204,7 @@ def fetch_f1_schedule_sync(year: int = 2025) -> list[dict]:
                 "circuit": event.get('Location', 'Unknown'),
                 "country": event.get('Country', ''),
                 "date": date_str,
-                "round": event.get('RoundNumber', 0),
+                "round": int(event.get('RoundNumber', 0)),
             })
 
         logger.info(f"Fetched {len(races)} F1 races for {year} from FastF1")
@@ -115,101 +221,121 @@ async def fetch_f1_schedule(year: int = 2025) -> list[dict]:
     Runs the sync FastF1 call in a thread pool.
     """
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(executor, fetch_f1_schedule_sync, year)
+    with external_call("FastF1"):
+        races = await loop.run_in_executor(executor, fetch_f1_schedule_sync, year)
+    # FastF1 errors come back as an empty schedule
+    if not races:
+        record_external_error("FastF1")
+    return races
 
 
-async def fetch_openf1_race_results(year: int, location: str) -> dict:
+async def fetch_openf1_race_results(
+    year: int, location: str, client: Optional[httpx.AsyncClient] = None
+) -> dict:
     """
     Fetch race results from OpenF1 API.
     OpenF1 provides real-time accurate race results.
+    Pass a shared `client` to reuse its connections across many races.
     """
-    try:
+    if client is None:
         async with httpx.AsyncClient() as client:
-            # Get session info for the race
-            sessions_url = f"https://api.openf1.org/v1/sessions?year={year}&session_name=Race"
+            return await fetch_openf1_race_results(year, location, client)
+
+    try:
+        # Get session info for the race
+        sessions_url = f"https://api.openf1.org/v1/sessions?year={year}&session_name=Race"
+        with external_call("OpenF1"):
             sessions_resp = await client.get(sessions_url, timeout=10.0)
-            sessions = sessions_resp.json()
-
-            # Find matching session by location
-            session_key = None
-            location_lower = location.lower()
-            for s in sessions:
-                if location_lower in s.get('location', '').lower() or \
-                   location_lower in s.get('country_name', '').lower() or \
-                   location_lower in s.get('circuit_short_name', '').lower():
-                    session_key = s['session_key']
-                    break
-
-            if not session_key:
-                logger.warning(f"No OpenF1 session found for {location}")
-                return {}
-
-            # Get drivers for this session
-            drivers_url = f"https://api.openf1.org/v1/drivers?session_key={session_key}"
+        sessions = sessions_resp.json()
+
+        # Find matching session by location
+        session_key = None
+        location_lower = location.lower()
+        for s in sessions:
+            if location_lower in s.get('location', '').lower() or \
+               location_lower in s.get('country_name', '').lower() or \
+               location_lower in s.get('circuit_short_name', '').lower():
+                session_key = s['session_key']
+                break
+
+        if not session_key:
+            logger.warning(f"No OpenF1 session found for {location}")
+            return {}
+
+        # Get drivers for this session
+        drivers_url = f"https://api.openf1.org/v1/drivers?session_key={session_key}"
+        with external_call("OpenF1"):
             drivers_resp = await client.get(drivers_url, timeout=10.0)
-            drivers_data = drivers_resp.json()
-
-            # Create driver number to name mapping
-            driver_map = {}
-            for d in drivers_data:
-                driver_map[d['driver_number']] = {
-                    'full_name': f"{d.get('first_name', '')} {d.get('last_name', '')}".strip(),
-                    'abbreviation': d.get('name_acronym', ''),
-                    'team': d.get('team_name', ''),
-                }
-
-            # Get final positions
-            positions_url = f"https://api.openf1.org/v1/position?session_key={session_key}"
+        drivers_data = drivers_resp.json()
+
+        # Create driver number to name mapping
+        driver_map = {}
+        for d in drivers_data:
+            driver_map[d['driver_number']] = {
+                'full_name': f"{d.get('first_name', '')} {d.get('last_name', '')}".strip(),
+                'abbreviation': d.get('name_acronym', ''),
+                'team': d.get('team_name', ''),
+            }
+
+        # Get final positions
+        positions_url = f"https://api.openf1.org/v1/position?session_key={session_key}"
+        with external_call("OpenF1"):
             positions_resp = await client.get(positions_url, timeout=10.0)
-            positions_data = positions_resp.json()
-
-            # Get the latest position for each driver
-            latest_positions = {}
-            for p in positions_data:
-                driver_num = p['driver_number']
-                latest_positions[driver_num] = p
-
-            # Sort by position
-            sorted_positions = sorted(
-                latest_positions.values(),
-                key=lambda x: x.get('position', 99)
-            )
+        positions_data = positions_resp.json()
 
-            # Build podium
-            podium = []
-            for p in sorted_positions[:3]:
-                driver_num = p['driver_number']
-                driver_info = driver_map.get(driver_num, {})
-                podium.append({
-                    "position": p['position'],
-                    "driver": driver_info.get('abbreviation', ''),
-                    "full_name": driver_info.get('full_name', f"Driver #{driver_num}"),
-                    "team": driver_info.get('team', ''),
-                })
+        # Get the latest position for each driver
+        latest_positions = {}
+        for p in positions_data:
+            driver_num = p['driver_number']
+            latest_positions[driver_num] = p
 
-            return {
-                "winner": podium[0]["full_name"] if podium else "",
-                "podium": podium,
-            }
+        # Sort by position
+        sorted_positions = sorted(
+            latest_positions.values(),
+            key=lambda x: x.get('position', 99)
+        )
+
+        # Build podium
+        podium = []
+        for p in sorted_positions[:3]:
+            driver_num = p['driver_number']
+            driver_info = driver_map.get(driver_num, {})
+            podium.append({
+                "position": p['position'],
+                "driver": driver_info.get('abbreviation', ''),
+                "full_name": driver_info.get('full_name', f"Driver #{driver_num}"),
+                "team": driver_info.get('team', ''),
+            })
+
+        return {
+            "winner": podium[0]["full_name"] if podium else "",
+            "podium": podium,
+        }
 
     except Exception as e:
         logger.error(f"Failed to fetch OpenF1 results for {location}: {e}")
         return {}
 
 
-async def fetch_f1_race_results(year: int, round_number: int, location: str = "") -> dict:
+async def fetch_f1_race_results(
+    year: int, round_number: int, location: str = "", client: Optional[httpx.AsyncClient] = None
+) -> dict:
     """
     Fetch F1 race results - tries OpenF1 first, falls back to FastF1.
     """
     # Try OpenF1 first (more reliable for recent races)
     if location:
-        results = await fetch_openf1_race_results(year, location)
+        results = await fetch_openf1_race_results(year, location, client)
         if results and results.get("winner"):
             return results
 
     # Fallback to FastF1 (for historical data)
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(executor, fetch_f1_race_results_sync, year, round_number)
+    with external_call("FastF1"):
+        results = await loop.run_in_executor(executor, fetch_f1_race_results_sync, year, round_number)
+    if not results:
+        record_external_error("FastF1")
+    return results
 
 
 def fetch_f1_race_results_sync(year: int, round_number: int) -> dict:
@@ -272,8 +398,11 @@ async def fetch_f1_standings(year: int = 2024) -> dict:
         async with httpx.AsyncClient() as client:
             # Fetch driver standings
             drivers_url = f"{JOLPICA_BASE_URL}/{year}/driverStandings.json"
-            drivers_resp = await client.get(drivers_url, timeout=10.0)
-            if drivers_resp.status_code == 200:
+            with external_call("Jolpica"):
+                drivers_resp = await client.get(drivers_url, timeout=10.0)
+            if drivers_resp.status_code != 200:
+                record_external_error("Jolpica")
+            else:
                 data = drivers_resp.json()
                 driver_list = data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
                 if driver_list:
@@ -292,8 +421,11 @@ async def fetch_f1_standings(year: int = 2024) -> dict:
 
             # Fetch constructor standings
             constructors_url = f"{JOLPICA_BASE_URL}/{year}/constructorStandings.json"
-            constructors_resp = await client.get(constructors_url, timeout=10.0)
-            if constructors_resp.status_code == 200:
+            with external_call("Jolpica"):
+                constructors_resp = await client.get(constructors_url, timeout=10.0)
+            if constructors_resp.status_code != 200:
+                record_external_error("Jolpica")
+            else:
                 data = constructors_resp.json()
                 constructor_list = data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
                 if constructor_list:
@@ -315,18 +447,20 @@ async def fetch_f1_standings(year: int = 2024) -> dict:
     return standings
 
 
+@track_job("standings")
 async def sync_f1_standings_to_storage() -> None:
-    """Sync F1 standings from Jolpica API to Azure Table Storage."""
+    """Sync F1 standings from Jolpica API to storage."""
     current_year = datetime.now().year
     standings = await fetch_f1_standings(current_year)
 
     if not standings["drivers"]:
         logger.warning("No F1 standings data to sync")
+        record_job_error()
         return
 
     try:
-        table_client = await get_async_table_client()
-        if not table_client:
+        storage = await get_storage()
+        if not storage:
             return
 
         # Store standings as a single entity with JSON data
@@ -340,38 +474,42 @@ async def sync_f1_standings_to_storage() -> None:
             "LastUpdated": datetime.now(timezone.utc).isoformat(),
         }
 
-        await table_client.upsert_entity(entity, mode=UpdateMode.REPLACE)
-        logger.info(f"Synced F1 {current_year} standings to Table Storage")
+        await storage.upsert_entity(entity, merge=False)
+        logger.info(f"Synced F1 {current_year} standings to storage")
 
-        await table_client.close()
+        # Standings aren't part of the race data version - drop pages that show them
+        render_cache.clear()
+        await announce_data_version()
+
+        await save_race_snapshot()
 
     except Exception as e:
         logger.error(f"Failed to sync F1 standings to storage: {e}")
+        record_job_error()
 
 
 async def get_f1_standings_from_storage() -> dict:
-    """Retrieve F1 standings from Azure Table Storage."""
+    """Retrieve F1 standings from storage."""
     current_year = datetime.now().year
     standings = {"drivers": [], "constructors": [], "season": current_year}
 
     try:
-        table_client = await get_async_table_client()
-        if not table_client:
+        storage = await get_storage()
+        if not storage:
             return standings
 
-        try:
-            entity = await table_client.get_entity("Standings", f"F1_{current_year}")
+        # Entity doesn't exist until the first standings sync
+        entity = await storage.get_entity("Standings", f"F1_{current_year}")
+        if entity:
             standings["drivers"] = json.loads(entity.get("DriversJson", "[]"))
             standings["constructors"] = json.loads(entity.get("ConstructorsJson", "[]"))
             standings["season"] = entity.get("Season", current_year)
-        except Exception:
-            # Entity doesn't exist yet, will be populated by sync
-            pass
-
-        await table_client.close()
 
     except Exception as e:
         logger.error(f"Failed to get F1 standings from storage: {e}")
+        snapshot = last_snapshot["data"]
+        if snapshot and snapshot.get("standings"):
+            return snapshot["standings"]
 
     return standings
 
@@ -441,31 +579,33 @@ INDYCAR_2026_SCHEDULE = [
 
 # 2026 Formula 1 Schedule
 # Source: https://www.formula1.com/en/racing/2026
+# "location" is how OpenF1 names the venue (its location or circuit_short_name),
+# used to find the race session when polling results
 F1_2026_SCHEDULE = [
-    {"name": "Australian Grand Prix", "circuit": "Albert Park Circuit", "date": "2026-03-08T05:00:00Z", "network": "ESPN", "country": "Australia"},
-    {"name": "Chinese Grand Prix", "circuit": "Shanghai International Circuit", "date": "2026-03-15T07:00:00Z", "network": "ESPN", "country": "China"},
-    {"name": "Japanese Grand Prix", "circuit": "Suzuka International Racing Course", "date": "2026-03-29T05:00:00Z", "network": "ESPN", "country": "Japan"},
-    {"name": "Bahrain Grand Prix", "circuit": "Bahrain International Circuit", "date": "2026-04-12T15:00:00Z", "network": "ESPN", "country": "Bahrain"},
-    {"name": "Saudi Arabian Grand Prix", "circuit": "Jeddah Corniche Circuit", "date": "2026-04-19T17:00:00Z", "network": "ESPN", "country": "Saudi Arabia"},
-    {"name": "Miami Grand Prix", "circuit": "Miami International Autodrome", "date": "2026-05-03T20:00:00Z", "network": "ESPN", "country": "USA"},
-    {"name": "Canadian Grand Prix", "circuit": "Circuit Gilles Villeneuve", "date": "2026-05-24T18:00:00Z", "network": "ESPN", "country": "Canada"},
-    {"name": "Monaco Grand Prix", "circuit": "Circuit de Monaco", "date": "2026-06-07T13:00:00Z", "network": "ESPN", "country": "Monaco"},
-    {"name": "Barcelona-Catalunya Grand Prix", "circuit": "Circuit de Barcelona-Catalunya", "date": "2026-06-14T13:00:00Z", "network": "ESPN", "country": "Spain"},
-    {"name": "Austrian Grand Prix", "circuit": "Red Bull Ring", "date": "2026-06-28T13:00:00Z", "network": "ESPN", "country": "Austria"},
-    {"name": "British Grand Prix", "circuit": "Silverstone Circuit", "date": "2026-07-05T14:00:00Z", "network": "ESPN", "country": "United Kingdom"},
-    {"name": "Belgian Grand Prix", "circuit": "Circuit de Spa-Francorchamps", "date": "2026-07-19T13:00:00Z", "network": "ESPN", "country": "Belgium"},
-    {"name": "Hungarian Grand Prix", "circuit": "Hungaroring", "date": "2026-07-26T13:00:00Z", "network": "ESPN", "country": "Hungary"},
-    {"name": "Dutch Grand Prix", "circuit": "Circuit Zandvoort", "date": "2026-08-23T13:00:00Z", "network": "ESPN", "country": "Netherlands"},
-    {"name": "Italian Grand Prix", "circuit": "Monza Circuit", "date": "2026-09-06T13:00:00Z", "network": "ESPN", "country": "Italy"},
-    {"name": "Spanish Grand Prix", "circuit": "Madrid Street Circuit", "date": "2026-09-13T13:00:00Z", "network": "ESPN", "country": "Spain"},
-    {"name": "Azerbaijan Grand Prix", "circuit": "Baku City Circuit", "date": "2026-09-26T11:00:00Z", "network": "ESPN", "country": "Azerbaijan"},
-    {"name": "Singapore Grand Prix", "circuit": "Marina Bay Street Circuit", "date": "2026-10-11T12:00:00Z", "network": "ESPN", "country": "Singapore"},
-    {"name": "United States Grand Prix", "circuit": "Circuit of the Americas", "date": "2026-10-25T19:00:00Z", "network": "ESPN", "country": "USA"},
-    {"name": "Mexican Grand Prix", "circuit": "Autódromo Hermanos Rodríguez", "date": "2026-11-01T20:00:00Z", "network": "ESPN", "country": "Mexico"},
-    {"name": "São Paulo Grand Prix", "circuit": "Autódromo José Carlos Pace", "date": "2026-11-08T17:00:00Z", "network": "ESPN", "country": "Brazil"},
-    {"name": "Las Vegas Grand Prix", "circuit": "Las Vegas Street Circuit", "date": "2026-11-21T06:00:00Z", "network": "ESPN", "country": "USA"},
-    {"name": "Qatar Grand Prix", "circuit": "Lusail International Circuit", "date": "2026-11-29T16:00:00Z", "network": "ESPN", "country": "Qatar"},
-    {"name": "Abu Dhabi Grand Prix", "circuit": "Yas Marina Circuit", "date": "2026-12-06T13:00:00Z", "network": "ESPN", "country": "United Arab Emirates"},
+    {"name": "Australian Grand Prix", "circuit": "Albert Park Circuit", "date": "2026-03-08T05:00:00Z", "network": "ESPN", "country": "Australia", "location": "Melbourne"},
+    {"name": "Chinese Grand Prix", "circuit": "Shanghai International Circuit", "date": "2026-03-15T07:00:00Z", "network": "ESPN", "country": "China", "location": "Shanghai"},
+    {"name": "Japanese Grand Prix", "circuit": "Suzuka International Racing Course", "date": "2026-03-29T05:00:00Z", "network": "ESPN", "country": "Japan", "location": "Suzuka"},
+    {"name": "Bahrain Grand Prix", "circuit": "Bahrain International Circuit", "date": "2026-04-12T15:00:00Z", "network": "ESPN", "country": "Bahrain", "location": "Sakhir"},
+    {"name": "Saudi Arabian Grand Prix", "circuit": "Jeddah Corniche Circuit", "date": "2026-04-19T17:00:00Z", "network": "ESPN", "country": "Saudi Arabia", "location": "Jeddah"},
+    {"name": "Miami Grand Prix", "circuit": "Miami International Autodrome", "date": "2026-05-03T20:00:00Z", "network": "ESPN", "country": "USA", "location": "Miami"},
+    {"name": "Canadian Grand Prix", "circuit": "Circuit Gilles Villeneuve", "date": "2026-05-24T18:00:00Z", "network": "ESPN", "country": "Canada", "location": "Montreal"},
+    {"name": "Monaco Grand Prix", "circuit": "Circuit de Monaco", "date": "2026-06-07T13:00:00Z", "network": "ESPN", "country": "Monaco", "location": "Monaco"},
+    {"name": "Barcelona-Catalunya Grand Prix", "circuit": "Circuit de Barcelona-Catalunya", "date": "2026-06-14T13:00:00Z", "network": "ESPN", "country": "Spain", "location": "Barcelona"},
+    {"name": "Austrian Grand Prix", "circuit": "Red Bull Ring", "date": "2026-06-28T13:00:00Z", "network": "ESPN", "country": "Austria", "location": "Spielberg"},
+    {"name": "British Grand Prix", "circuit": "Silverstone Circuit", "date": "2026-07-05T14:00:00Z", "network": "ESPN", "country": "United Kingdom", "location": "Silverstone"},
+    {"name": "Belgian Grand Prix", "circuit": "Circuit de Spa-Francorchamps", "date": "2026-07-19T13:00:00Z", "network": "ESPN", "country": "Belgium", "location": "Spa-Francorchamps"},
+    {"name": "Hungarian Grand Prix", "circuit": "Hungaroring", "date": "2026-07-26T13:00:00Z", "network": "ESPN", "country": "Hungary", "location": "Hungaroring"},
+    {"name": "Dutch Grand Prix", "circuit": "Circuit Zandvoort", "date": "2026-08-23T13:00:00Z", "network": "ESPN", "country": "Netherlands", "location": "Zandvoort"},
+    {"name": "Italian Grand Prix", "circuit": "Monza Circuit", "date": "2026-09-06T13:00:00Z", "network": "ESPN", "country": "Italy", "location": "Monza"},
+    {"name": "Spanish Grand Prix", "circuit": "Madrid Street Circuit", "date": "2026-09-13T13:00:00Z", "network": "ESPN", "country": "Spain", "location": "Madrid"},
+    {"name": "Azerbaijan Grand Prix", "circuit": "Baku City Circuit", "date": "2026-09-26T11:00:00Z", "network": "ESPN", "country": "Azerbaijan", "location": "Baku"},
+    {"name": "Singapore Grand Prix", "circuit": "Marina Bay Street Circuit", "date": "2026-10-11T12:00:00Z", "network": "ESPN", "country": "Singapore", "location": "Singapore"},
+    {"name": "United States Grand Prix", "circuit": "Circuit of the Americas", "date": "2026-10-25T19:00:00Z", "network": "ESPN", "country": "USA", "location": "Austin"},
+    {"name": "Mexican Grand Prix", "circuit": "Autódromo Hermanos Rodríguez", "date": "2026-11-01T20:00:00Z", "network": "ESPN", "country": "Mexico", "location": "Mexico City"},
+    {"name": "São Paulo Grand Prix", "circuit": "Autódromo José Carlos Pace", "date": "2026-11-08T17:00:00Z", "network": "ESPN", "country": "Brazil", "location": "Interlagos"},
+    {"name": "Las Vegas Grand Prix", "circuit": "Las Vegas Street Circuit", "date": "2026-11-21T06:00:00Z", "network": "ESPN", "country": "USA", "location": "Las Vegas"},
+    {"name": "Qatar Grand Prix", "circuit": "Lusail International Circuit", "date": "2026-11-29T16:00:00Z", "network": "ESPN", "country": "Qatar", "location": "Lusail"},
+    {"name": "Abu Dhabi Grand Prix", "circuit": "Yas Marina Circuit", "date": "2026-12-06T13:00:00Z", "network": "ESPN", "country": "United Arab Emirates", "location": "Yas Marina"},
 ]
 
 # =============================================================================
@@ -559,101 +699,374 @@ INDYCAR_2024_SCHEDULE = [
 
 
 # =============================================================================
-# AZURE TABLE STORAGE HELPERS
+# STORAGE HELPERS
 # =============================================================================
 
-async def get_async_table_client():
-    """Get async Azure Table client."""
-    if not AZURE_STORAGE_CONNECTION_STRING:
-        logger.warning("AZURE_STORAGE_CONNECTION_STRING not configured")
-        return None
+# Shared storage backend, opened once in lifespan and reused by every request and job
+_storage: Optional[StorageBackend] = None
+_storage_lock = asyncio.Lock()
 
-    service = AsyncTableServiceClient.from_connection_string(AZURE_STORAGE_CONNECTION_STRING)
 
-    # Create table if not exists
-    try:
-        await service.create_table(TABLE_NAME)
-        logger.info(f"Created table: {TABLE_NAME}")
-    except Exception:
-        pass  # Table already exists
+async def init_storage() -> Optional[StorageBackend]:
+    """
+    Open the configured storage backend (Azure Table Storage or SQLite).
+    The backend keeps its connections open so they are reused across calls.
+    """
+    global _storage
+
+    async with _storage_lock:
+        if _storage is not None:
+            return _storage
+
+        storage = create_storage_backend(
+            STORAGE_BACKEND, AZURE_STORAGE_CONNECTION_STRING, TABLE_NAME, SQLITE_DB_PATH
+        )
+        if storage is None:
+            return None
+
+        await storage.open()
+        _storage = storage
+        return _storage
+
+
+async def close_storage() -> None:
+    """Close the shared storage backend on shutdown."""
+    global _storage
+
+    if _storage is not None:
+        await _storage.close()
+    _storage = None
 
-    return service.get_table_client(TABLE_NAME)
 
+async def get_storage() -> Optional[StorageBackend]:
+    """Get the shared storage backend (opened on first use)."""
+    if _storage is not None:
+        return _storage
+    return await init_storage()
 
-async def upsert_race_event(table_client, event: dict, merge: bool = True) -> None:
-    """Upsert a race event to Azure Table Storage.
+
+async def upsert_race_event(storage, event: dict, merge: bool = True) -> None:
+    """Upsert a race event to storage.
 
     Args:
-        table_client: Azure Table client
+        storage: Storage backend
         event: The event data to upsert
         merge: If True, uses MERGE mode (only updates provided fields).
                If False, uses REPLACE mode (replaces entire entity).
     """
-    if not table_client:
+    if not storage:
         return
     try:
-        from azure.data.tables import UpdateMode
-        mode = UpdateMode.MERGE if merge else UpdateMode.REPLACE
-        await table_client.upsert_entity(event, mode=mode)
-        logger.info(f"Upserted event: {event.get('RaceName', 'Unknown')}")
+        await write_pipeline.submit(lambda: storage.upsert_entity(event, merge=merge), label="upsert")
+        STORAGE_WRITES.labels("upsert").inc()
+        logger.debug(f"Upserted event: {event.get('RaceName', event.get('RowKey', 'Unknown'))}")
     except Exception as e:
         logger.error(f"Failed to upsert event: {e}")
 
 
-async def query_race_events(series_filter: Optional[str] = None) -> list[dict]:
-    """Query race events from Azure Table Storage."""
+def build_transaction_batches(operations: list[tuple]) -> list[list[tuple]]:
+    """
+    Group (operation, entity[, kwargs]) tuples into storage transactions.
+    A transaction must share one PartitionKey, hold at most TABLE_BATCH_SIZE
+    operations and touch each RowKey once (the last operation wins).
+    """
+    by_partition: dict[str, dict[str, tuple]] = {}
+    for op in operations:
+        entity = op[1]
+        by_partition.setdefault(entity["PartitionKey"], {})[entity["RowKey"]] = op
+
+    batches = []
+    for partition_ops in by_partition.values():
+        ops = list(partition_ops.values())
+        for i in range(0, len(ops), TABLE_BATCH_SIZE):
+            batches.append(ops[i:i + TABLE_BATCH_SIZE])
+    return batches
+
+
+async def submit_transaction_batches(storage, operations: list[tuple], label: str = "entities") -> int:
+    """
+    Write operations as transactional batches.
+    Each failed batch is retried on its own; returns the number of operations committed.
+    """
+    if not storage or not operations:
+        return 0
+
+    batches = build_transaction_batches(operations)
+
+    async def submit_batch(index: int, batch: list[tuple]) -> int:
+        for attempt in range(1, TABLE_BATCH_RETRIES + 2):
+            try:
+                await write_pipeline.submit(lambda: storage.submit_transaction(batch), label="transaction")
+                for op in batch:
+                    STORAGE_WRITES.labels(op[0]).inc()
+                return len(batch)
+            except TableTransactionError as e:
+                logger.warning(
+                    f"Batch {index}/{len(batches)} of {label} failed on attempt {attempt} "
+                    f"(partition {batch[0][1]['PartitionKey']}, {len(batch)} ops): {e}"
+                )
+            except Exception as e:
+                logger.warning(f"Batch {index}/{len(batches)} of {label} failed on attempt {attempt}: {e}")
+            if attempt <= TABLE_BATCH_RETRIES:
+                # Back off - failures are often throttling, which an immediate retry makes worse
+                await asyncio.sleep(TABLE_BATCH_RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+        logger.error(f"Giving up on batch {index}/{len(batches)} of {label} ({len(batch)} ops)")
+        return 0
+
+    # Batches are independent, so let the pipeline run them concurrently
+    committed = sum(await asyncio.gather(
+        *(submit_batch(index, batch) for index, batch in enumerate(batches, start=1))
+    ))
+
+    total = sum(len(batch) for batch in batches)
+    logger.info(f"Committed {committed}/{total} {label} in {len(batches)} batches")
+    return committed
+
+
+def race_partition_keys(series: Optional[str] = None, seasons: Optional[list[int]] = None) -> list[str]:
+    """Get the PartitionKeys holding race events for a series and/or seasons."""
+    series_list = [series] if series else RACE_SERIES
+    return [f"{s}_{season}" for s in series_list for season in (seasons or RACE_SEASONS)]
+
+
+async def query_storage_race_events(
+    series: Optional[str] = None,
+    season: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    select: Optional[list[str]] = None,
+) -> list[dict]:
+    """
+    Query race events from storage using key lookups only (raises on failure).
+
+    Series and season select the partitions to read; a start/end window is
+    turned into a RowKey range, so no query scans unrelated rows. `select`
+    limits the properties returned for each entity.
+    """
+    storage = await get_storage()
+    if not storage:
+        return []
+
+    if season:
+        seasons = [season]
+    else:
+        seasons = [
+            y for y in RACE_SEASONS
+            if (not start or y >= start.year) and (not end or y <= end.year)
+        ]
+
+    key_range = row_key_range(start, end) if (start or end) else None
+
+    if select and "StartTime" not in select:
+        select = [*select, "StartTime"]
+
+    async def query_partition(partition_key: str) -> list[dict]:
+        return await storage.query_entities(partition_key, key_range, select=select)
+
+    partitions = await asyncio.gather(*(
+        query_partition(partition_key) for partition_key in race_partition_keys(series, seasons)
+    ))
+    entities = [entity for partition in partitions for entity in partition]
+    entities.sort(key=lambda x: x.get("StartTime", ""))
+    return entities
+
+
+async def load_race_events_from_storage() -> list[dict]:
+    """Load every race event from storage (raises on failure)."""
+    return await query_storage_race_events()
+
+
+async def load_race_events() -> list[dict]:
+    """Load race events from storage, falling back to the last on-disk snapshot."""
     try:
-        table_client = await get_async_table_client()
-        if not table_client:
-            return []
+        return await load_race_events_from_storage()
+    except Exception as e:
+        snapshot = last_snapshot["data"] or await load_snapshot(SNAPSHOT_PATH)
+        if not snapshot:
+            raise
+        logger.warning(f"Storage query failed ({e}) - serving {len(snapshot['events'])} events from snapshot")
+        last_snapshot["data"] = snapshot
+        return snapshot["events"]
+
+
+async def save_race_snapshot() -> None:
+    """Persist the current race events, standings and news as the last-known-good snapshot."""
+    if not race_store.is_loaded:
+        return
+
+    events = await race_store.get(load_race_events)
+    standings = await get_f1_standings_from_storage()
+    news = news_cache["data"]
+    if await save_snapshot(SNAPSHOT_PATH, events, standings, news):
+        last_snapshot["data"] = {"events": events, "standings": standings, "news": news}
+
+
+async def restore_race_snapshot() -> None:
+    """Warm the race store and news cache from the on-disk snapshot at startup."""
+    global news_cache
 
-        filter_query = f"PartitionKey eq '{PARTITION_KEY}'"
-        if series_filter:
-            filter_query += f" and Series eq '{series_filter}'"
+    snapshot = await load_snapshot(SNAPSHOT_PATH)
+    if not snapshot:
+        logger.info(f"No snapshot found at {SNAPSHOT_PATH} - starting cold")
+        return
 
-        entities = []
-        async for entity in table_client.query_entities(filter_query):
-            entities.append(dict(entity))
+    last_snapshot["data"] = snapshot
+    race_store.swap(snapshot["events"])
+    if snapshot.get("news") and not news_cache["data"]:
+        # Keep the snapshot time so the TTL still triggers a refresh
+        news_cache = {
+            "data": snapshot["news"],
+            "timestamp": datetime.fromisoformat(snapshot["saved_at"]),
+        }
+    logger.info(f"Restored snapshot from {snapshot['saved_at']} ({len(snapshot['events'])} events)")
 
-        # Sort by StartTime
-        entities.sort(key=lambda x: x.get("StartTime", ""))
 
-        await table_client.close()
-        return entities
+async def refresh_race_store(save: bool = True, announce: bool = True) -> None:
+    """
+    Reload the in-memory race store after a sync has written new data.
+    If storage can't be read, the current (last-known-good) data stays in place.
+    `announce` tells the other workers to reload too.
+    """
+    previous = race_store.index
+    try:
+        await race_store.refresh(load_race_events_from_storage)
+    except Exception as e:
+        logger.error(f"Failed to refresh race store: {e}")
+        return
+
+    publish_race_changes(previous, race_store.index)
+
+    if save:
+        await save_race_snapshot()
+    if announce:
+        await announce_data_version()
+
+
+# =============================================================================
+# MULTI-WORKER COORDINATION
+# =============================================================================
+
+# Marker entity the leader bumps after every data change; followers poll it
+DATA_VERSION_KEY = "DataVersion"
+seen_data_version: dict = {"version": None}
+
+
+async def read_data_version() -> Optional[str]:
+    storage = await get_storage()
+    if not storage:
+        return None
+    entity = await storage.get_entity(META_PARTITION, DATA_VERSION_KEY)
+    return entity.get("Version") if entity else None
+
+
+async def announce_data_version() -> None:
+    """Record a new data version so the other workers reload their caches."""
+    try:
+        storage = await get_storage()
+        if not storage:
+            return
+        version = uuid.uuid4().hex
+        await storage.upsert_entity({
+            "PartitionKey": META_PARTITION,
+            "RowKey": DATA_VERSION_KEY,
+            "Version": version,
+            "UpdatedAt": datetime.now(timezone.utc).isoformat(),
+        }, merge=False)
+        seen_data_version["version"] = version
+    except Exception as e:
+        logger.error(f"Failed to announce data version: {e}")
+
+
+async def follow_data_updates() -> None:
+    """
+    On non-leader workers, reload the race store and drop rendered pages
+    whenever the leader announces a new data version.
+    """
+    try:
+        seen_data_version["version"] = await read_data_version()
+    except Exception as e:
+        logger.error(f"Failed to read data version: {e}")
+
+    while True:
+        await asyncio.sleep(DATA_VERSION_POLL_SECONDS)
+        if leader_election.is_leader:
+            continue
+        try:
+            version = await read_data_version()
+        except Exception as e:
+            logger.error(f"Failed to read data version: {e}")
+            continue
+        if version is None or version == seen_data_version["version"]:
+            continue
+
+        seen_data_version["version"] = version
+        logger.info("Leader synced new data - reloading race store")
+        await refresh_race_store(save=False, announce=False)
+        # Standings and news changes aren't in the race data version either
+        render_cache.clear()
+
+
+def project_races(races: list[dict], select: Optional[list[str]] = None) -> list[dict]:
+    """Copy races so callers can't modify the cached events, keeping only the `select` fields if given."""
+    if select:
+        return [{field: race[field] for field in select if field in race} for race in races]
+    return [dict(race) for race in races]
+
+
+async def query_race_page(
+    series: Optional[str] = None,
+    lower: str = "",
+    upper: str = "~",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> tuple[list[dict], Optional[str]]:
+    """
+    One page of race events in RowKey (start time) order, served from the
+    in-memory race store. Returns (events, next_cursor); the events are the
+    cached dicts, so project_races() them before handing them out.
+    """
+    try:
+        return await race_store.page(
+            load_race_events, lower=lower, upper=upper, cursor=cursor, limit=limit, series=series
+        )
     except Exception as e:
         logger.error(f"Failed to query events: {e}")
-        return []
+        return [], None
+
+
+async def get_race_index() -> RaceIndex:
+    """Get the time-sorted race index for the current data version."""
+    record_cache("race_store", race_store.is_loaded)
+    try:
+        return await race_store.get_index(load_race_events)
+    except Exception as e:
+        logger.error(f"Failed to query events: {e}")
+        return RaceIndex([])
 
 
 # =============================================================================
 # BACKGROUND DATA SYNC WORKER
 # =============================================================================
 
-async def delete_series_entries(table_client, series: str) -> int:
-    """Delete all entries for a specific series from Azure Table Storage."""
-    if not table_client:
+async def delete_series_entries(storage, series: str) -> int:
+    """Delete all entries for a specific series from storage."""
+    if not storage:
         return 0
 
     deleted_count = 0
     try:
-        filter_query = f"PartitionKey eq '{PARTITION_KEY}' and Series eq '{series}'"
         entities_to_delete = []
 
-        async for entity in table_client.query_entities(filter_query):
-            entities_to_delete.append({
-                "PartitionKey": entity["PartitionKey"],
-                "RowKey": entity["RowKey"]
-            })
+        for partition_key in race_partition_keys(series):
+            for entity in await storage.query_entities(partition_key, select=["PartitionKey", "RowKey"]):
+                entities_to_delete.append(("delete", {
+                    "PartitionKey": entity["PartitionKey"],
+                    "RowKey": entity["RowKey"]
+                }))
 
-        for entity in entities_to_delete:
-            try:
-                await table_client.delete_entity(
-                    partition_key=entity["PartitionKey"],
-                    row_key=entity["RowKey"]
-                )
-                deleted_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to delete entity {entity['RowKey']}: {e}")
+        deleted_count = await submit_transaction_batches(
+            storage, entities_to_delete, label=f"{series} deletes"
+        )
 
         logger.info(f"Deleted {deleted_count} {series} entries from storage")
         return deleted_count
@@ -662,250 +1075,427 @@ async def delete_series_entries(table_client, series: str) -> int:
         return deleted_count
 
 
-async def sync_race_data():
-    """Main data sync function that runs every 24 hours."""
-    logger.info("Starting data sync...")
+def entity_content_hash(entity: dict, fields) -> str:
+    """Hash the given fields of an entity so unchanged rows can be skipped."""
+    content = {field: entity.get(field) for field in fields}
+    return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def reconcile_race_events(storage, entities: list[dict], partitions: Optional[set[str]] = None) -> dict:
+    """
+    Bring storage in line with the freshly built schedule by writing only the difference.
+
+    Current rows are loaded once and compared by a content hash per key.
+    New rows are inserted, changed rows are merged (leaving odds fields and
+    stored results alone) and rows that are no longer in the schedule are deleted.
+
+    Deletes are limited to `partitions` (by default, those the schedule has
+    rows in), so a source that failed and returned nothing never empties
+    its season in storage.
+    """
+    if partitions is None:
+        partitions = {entity["PartitionKey"] for entity in entities}
+
+    existing = {
+        (entity["PartitionKey"], entity["RowKey"]): entity
+        for entity in await query_storage_race_events()
+    }
+
+    # Later entries win for duplicate keys, as they would with sequential upserts
+    desired = {(entity["PartitionKey"], entity["RowKey"]): entity for entity in entities}
+
+    summary = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+    operations = []
+
+    for key, entity in desired.items():
+        current = existing.get(key)
+
+        if current is None:
+            operations.append(("upsert", entity, {"mode": UpdateMode.MERGE}))
+            summary["inserted"] += 1
+            continue
+
+        # Results polls write podiums the schedule doesn't know yet - an empty
+        # schedule value must never clear a stored result
+        skipped = {*ODDS_FIELDS, *(field for field in RESULT_FIELDS if not entity.get(field))}
+        fields = [k for k in entity if k not in ("PartitionKey", "RowKey") and k not in skipped]
+        if entity_content_hash(entity, fields) == entity_content_hash(current, fields):
+            summary["unchanged"] += 1
+            continue
 
+        changes = {k: v for k, v in entity.items() if k not in skipped}
+        operations.append(("upsert", changes, {"mode": UpdateMode.MERGE}))
+        summary["updated"] += 1
+
+    for key, current in existing.items():
+        if key not in desired and key[0] in partitions and current.get("Series") in RACE_SERIES:
+            operations.append(("delete", {"PartitionKey": key[0], "RowKey": key[1]}))
+            summary["deleted"] += 1
+
+    if operations:
+        await submit_transaction_batches(storage, operations, label="race event changes")
+
+    for change, count in summary.items():
+        SYNC_CHANGES.labels(change).inc(count)
+    logger.info(
+        f"Sync changes: {summary['inserted']} inserted, {summary['updated']} updated, "
+        f"{summary['deleted']} deleted, {summary['unchanged']} unchanged"
+    )
+    return summary
+
+
+# Fetched F1 podiums, one partition per season ("Results_2025") keyed by
+# round ("05"). A result is final once penalties can no longer change it;
+# final results are never fetched again.
+RESULTS_FINAL_AFTER = timedelta(days=3)
+
+
+def results_partition_key(season: int) -> str:
+    return f"Results_{season}"
+
+
+def build_results_entity(season: int, round_number: int, race_name: str, start: datetime, podium: list[dict]) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "PartitionKey": results_partition_key(season),
+        "RowKey": f"{round_number:02d}",
+        "Season": season,
+        "Round": round_number,
+        "RaceName": race_name,
+        "Winner": podium[0]["full_name"] if len(podium) > 0 else "",
+        "Podium2": podium[1]["full_name"] if len(podium) > 1 else "",
+        "Podium3": podium[2]["full_name"] if len(podium) > 2 else "",
+        "PodiumJson": json.dumps(podium),
+        "Final": len(podium) >= 3 and now - start >= RESULTS_FINAL_AFTER,
+        "FetchedAt": now.isoformat(),
+    }
+
+
+async def load_stored_results(storage, season: int) -> dict[int, dict]:
+    """Stored results of a season by round number (empty if they can't be read)."""
     try:
-        table_client = await get_async_table_client()
-        if not table_client:
-            logger.warning("No table client - skipping sync")
-            return
+        entities = await storage.query_entities(results_partition_key(season))
+    except Exception as e:
+        logger.error(f"Failed to load stored {season} results: {e}")
+        return {}
+    return {int(entity["Round"]): entity for entity in entities}
 
-        # Clean up old entries before syncing fresh data
-        logger.info("Cleaning up old F1 entries...")
-        await delete_series_entries(table_client, "F1")
-        logger.info("Cleaning up old NASCAR entries...")
-        await delete_series_entries(table_client, "NASCAR")
-        logger.info("Cleaning up old IndyCar entries...")
-        await delete_series_entries(table_client, "IndyCar")
-
-        # Sync F1 races from FastF1
-        logger.info("Syncing F1 data from FastF1...")
-        f1_races = await fetch_f1_schedule(2025)
-        now = datetime.now(timezone.utc)
 
-        for race in f1_races:
-            # Try to match circuit from our track data
-            track_info = get_track_info("F1", race["circuit"])
+async def save_race_results(storage, entities: list[dict]) -> None:
+    await submit_transaction_batches(
+        storage,
+        [("upsert", entity, {"mode": UpdateMode.REPLACE}) for entity in entities],
+        label="race results",
+    )
+
+
+# Maximum number of race results fetches in flight during a sync
+RESULTS_FETCH_CONCURRENCY = int(os.getenv("RESULTS_FETCH_CONCURRENCY", "4"))
+
 
-            # Check if race is completed and fetch results
-            winner = ""
-            podium2 = ""
-            podium3 = ""
+async def timed(label: str, awaitable):
+    """Await `awaitable`, logging how long it took."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        logger.info(f"{label} took {time.perf_counter() - start:.2f}s")
+
+
+async def fetch_completed_f1_podiums(storage, year: int, f1_races: list[dict]) -> dict[int, list[dict]]:
+    """
+    Podiums of every completed round, by round number. Final results come
+    from the results store; only new and provisional ones are fetched,
+    concurrently (at most RESULTS_FETCH_CONCURRENCY at once) over one shared
+    HTTP client, and written back to the store.
+    """
+    now = datetime.now(timezone.utc)
+    completed = [
+        race for race in f1_races
+        if race.get("round", 0) > 0 and datetime.fromisoformat(race["date"].replace('Z', '+00:00')) < now
+    ]
+    stored = await load_stored_results(storage, year)
+    podiums = {
+        round_number: json.loads(entity.get("PodiumJson") or "[]")
+        for round_number, entity in stored.items()
+    }
+    to_fetch = [race for race in completed if not stored.get(race["round"], {}).get("Final")]
+    semaphore = asyncio.Semaphore(RESULTS_FETCH_CONCURRENCY)
+
+    async def fetch_podium(client: httpx.AsyncClient, race: dict) -> list[dict]:
+        async with semaphore:
             try:
-                race_time = datetime.fromisoformat(race["date"].replace('Z', '+00:00'))
-                if race_time < now and race.get("round", 0) > 0:
-                    # Race has happened, fetch results using OpenF1 API
-                    logger.info(f"Fetching results for {race['name']} (Round {race['round']})...")
-                    results = await fetch_f1_race_results(2025, race["round"], race.get("circuit", ""))
-                    if results and results.get("podium"):
-                        podium = results["podium"]
-                        winner = podium[0]["full_name"] if len(podium) > 0 else ""
-                        podium2 = podium[1]["full_name"] if len(podium) > 1 else ""
-                        podium3 = podium[2]["full_name"] if len(podium) > 2 else ""
-                        logger.info(f"Results: 1st {winner}, 2nd {podium2}, 3rd {podium3}")
+                results = await timed(
+                    f"Results for {race['name']} (Round {race['round']})",
+                    fetch_f1_race_results(year, race["round"], race.get("circuit", ""), client=client),
+                )
             except Exception as e:
-                logger.error(f"Error checking race results: {e}")
-
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "F1", race["name"].replace(" ", "")),
-                "Series": "F1",
-                "RaceName": race["name"],
-                "Venue": race.get("circuit", "TBD"),
-                "StartTime": race["date"],
-                "Network": track_info.get("network", "ESPN") if track_info else "ESPN",
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": winner,
-                "Podium2": podium2,
-                "Podium3": podium3,
-                "Country": race.get("country", track_info.get("country", "") if track_info else ""),
-                "RoundNumber": race.get("round", 0),
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(f1_races)} F1 races from FastF1")
-
-        # Sync NASCAR 2026 races
-        logger.info("Syncing NASCAR 2026 data...")
-        for race in NASCAR_2026_SCHEDULE:
-            track_info = get_track_info("NASCAR", race["circuit"])
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "NASCAR", race["name"].replace(" ", "")),
-                "Series": "NASCAR",
-                "RaceName": race["name"],
-                "Venue": race["circuit"],
-                "StartTime": race["date"],
-                "Network": race.get("network", track_info.get("network", "FOX") if track_info else "FOX"),
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": "",
-                "Country": track_info.get("country", "USA") if track_info else "USA",
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(NASCAR_2026_SCHEDULE)} NASCAR races")
-
-        # Sync IndyCar 2026 races
-        logger.info("Syncing IndyCar 2026 data...")
-        for race in INDYCAR_2026_SCHEDULE:
-            track_info = get_track_info("IndyCar", race["circuit"])
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "IndyCar", race["name"].replace(" ", "")),
-                "Series": "IndyCar",
-                "RaceName": race["name"],
-                "Venue": race["circuit"],
-                "StartTime": race["date"],
-                "Network": race.get("network", track_info.get("network", "NBC") if track_info else "NBC"),
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": "",
-                "Country": track_info.get("country", "USA") if track_info else "USA",
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(INDYCAR_2026_SCHEDULE)} IndyCar races")
-
-        # Sync F1 2026 races
-        logger.info("Syncing F1 2026 data...")
-        for race in F1_2026_SCHEDULE:
-            track_info = get_track_info("F1", race["circuit"])
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "F1", race["name"].replace(" ", "")),
-                "Series": "F1",
-                "RaceName": race["name"],
-                "Venue": race["circuit"],
-                "StartTime": race["date"],
-                "Network": race.get("network", "ESPN"),
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": "",
-                "Podium2": "",
-                "Podium3": "",
-                "Country": race.get("country", ""),
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(F1_2026_SCHEDULE)} F1 2026 races")
-
-        # Sync F1 2024 historical data
-        logger.info("Syncing F1 2024 historical data...")
-        for race in F1_2024_SCHEDULE:
-            track_info = get_track_info("F1", race["circuit"])
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "F1", race["name"].replace(" ", "")),
-                "Series": "F1",
-                "RaceName": race["name"],
-                "Venue": race["circuit"],
-                "StartTime": race["date"],
-                "Network": race.get("network", "ESPN"),
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": race.get("winner", ""),
-                "Podium2": race.get("podium2", ""),
-                "Podium3": race.get("podium3", ""),
-                "Country": race.get("country", ""),
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(F1_2024_SCHEDULE)} F1 2024 races")
-
-        # Sync NASCAR 2024 historical data
-        logger.info("Syncing NASCAR 2024 historical data...")
-        for race in NASCAR_2024_SCHEDULE:
-            track_info = get_track_info("NASCAR", race["circuit"])
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "NASCAR", race["name"].replace(" ", "")),
-                "Series": "NASCAR",
-                "RaceName": race["name"],
-                "Venue": race["circuit"],
-                "StartTime": race["date"],
-                "Network": race.get("network", "FOX"),
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": race.get("winner", ""),
-                "Country": track_info.get("country", "USA") if track_info else "USA",
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(NASCAR_2024_SCHEDULE)} NASCAR 2024 races")
-
-        # Sync IndyCar 2024 historical data
-        logger.info("Syncing IndyCar 2024 historical data...")
-        for race in INDYCAR_2024_SCHEDULE:
-            track_info = get_track_info("IndyCar", race["circuit"])
-            entity = {
-                "PartitionKey": PARTITION_KEY,
-                "RowKey": generate_row_key(race["date"], "IndyCar", race["name"].replace(" ", "")),
-                "Series": "IndyCar",
-                "RaceName": race["name"],
-                "Venue": race["circuit"],
-                "StartTime": race["date"],
-                "Network": race.get("network", "NBC"),
-                "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
-                "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
-                "Odds_Data": "N/A",
-                "Polymarket_Prob": "N/A",
-                "Winner": race.get("winner", ""),
-                "Country": track_info.get("country", "USA") if track_info else "USA",
-            }
-            await upsert_race_event(table_client, entity)
-        logger.info(f"Synced {len(INDYCAR_2024_SCHEDULE)} IndyCar 2024 races")
+                logger.error(f"Error checking race results for {race['name']}: {e}")
+                return []
+        return (results or {}).get("podium") or []
+
+    start = time.perf_counter()
+    async with httpx.AsyncClient() as client:
+        fetched = await asyncio.gather(*(fetch_podium(client, race) for race in to_fetch))
+
+    # A failed fetch keeps the provisional podium we already have
+    fresh = [(race, podium) for race, podium in zip(to_fetch, fetched) if podium]
+    podiums.update({race["round"]: podium for race, podium in fresh})
+    await save_race_results(storage, [
+        build_results_entity(
+            year, race["round"], race["name"],
+            datetime.fromisoformat(race["date"].replace('Z', '+00:00')), podium,
+        )
+        for race, podium in fresh
+    ])
+
+    logger.info(
+        f"F1 results: {len(completed) - len(to_fetch)} final from storage, "
+        f"fetched {len(fresh)}/{len(to_fetch)} in {time.perf_counter() - start:.2f}s"
+    )
+    return podiums
+
+
+def build_f1_entity(race: dict, podium: list[dict]) -> dict:
+    """Entity for a race from the FastF1 schedule, with its podium if it has one."""
+    # Try to match circuit from our track data
+    track_info = get_track_info("F1", race["circuit"])
+    return {
+        "PartitionKey": generate_partition_key("F1", race["date"]),
+        "RowKey": generate_row_key(race["date"], "F1", race["name"].replace(" ", "")),
+        "Series": "F1",
+        "RaceName": race["name"],
+        "Venue": race.get("circuit", "TBD"),
+        "StartTime": race["date"],
+        "Network": track_info.get("network", "ESPN") if track_info else "ESPN",
+        "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+        "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+        "Odds_Data": "N/A",
+        "Polymarket_Prob": "N/A",
+        "Winner": podium[0]["full_name"] if len(podium) > 0 else "",
+        "Podium2": podium[1]["full_name"] if len(podium) > 1 else "",
+        "Podium3": podium[2]["full_name"] if len(podium) > 2 else "",
+        "Country": race.get("country", track_info.get("country", "") if track_info else ""),
+        "RoundNumber": race.get("round", 0),
+    }
+
+
+def build_static_race_entities() -> list[dict]:
+    """Entities for the hardcoded schedules (2026 calendars and 2024 history) - no network I/O."""
+    entities = []
+
+    # Sync NASCAR 2026 races
+    for race in NASCAR_2026_SCHEDULE:
+        track_info = get_track_info("NASCAR", race["circuit"])
+        entity = {
+            "PartitionKey": generate_partition_key("NASCAR", race["date"]),
+            "RowKey": generate_row_key(race["date"], "NASCAR", race["name"].replace(" ", "")),
+            "Series": "NASCAR",
+            "RaceName": race["name"],
+            "Venue": race["circuit"],
+            "StartTime": race["date"],
+            "Network": race.get("network", track_info.get("network", "FOX") if track_info else "FOX"),
+            "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+            "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+            "Odds_Data": "N/A",
+            "Polymarket_Prob": "N/A",
+            "Winner": "",
+            "Country": track_info.get("country", "USA") if track_info else "USA",
+        }
+        entities.append(entity)
+    logger.info(f"Prepared {len(NASCAR_2026_SCHEDULE)} NASCAR races")
+
+    # Sync IndyCar 2026 races
+    for race in INDYCAR_2026_SCHEDULE:
+        track_info = get_track_info("IndyCar", race["circuit"])
+        entity = {
+            "PartitionKey": generate_partition_key("IndyCar", race["date"]),
+            "RowKey": generate_row_key(race["date"], "IndyCar", race["name"].replace(" ", "")),
+            "Series": "IndyCar",
+            "RaceName": race["name"],
+            "Venue": race["circuit"],
+            "StartTime": race["date"],
+            "Network": race.get("network", track_info.get("network", "NBC") if track_info else "NBC"),
+            "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+            "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+            "Odds_Data": "N/A",
+            "Polymarket_Prob": "N/A",
+            "Winner": "",
+            "Country": track_info.get("country", "USA") if track_info else "USA",
+        }
+        entities.append(entity)
+    logger.info(f"Prepared {len(INDYCAR_2026_SCHEDULE)} IndyCar races")
+
+    # Sync F1 2026 races
+    for race in F1_2026_SCHEDULE:
+        track_info = get_track_info("F1", race["circuit"])
+        entity = {
+            "PartitionKey": generate_partition_key("F1", race["date"]),
+            "RowKey": generate_row_key(race["date"], "F1", race["name"].replace(" ", "")),
+            "Series": "F1",
+            "RaceName": race["name"],
+            "Venue": race["circuit"],
+            "StartTime": race["date"],
+            "Network": race.get("network", "ESPN"),
+            "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+            "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+            "Odds_Data": "N/A",
+            "Polymarket_Prob": "N/A",
+            "Winner": "",
+            "Podium2": "",
+            "Podium3": "",
+            "Country": race.get("country", ""),
+            "Location": race.get("location", ""),
+        }
+        entities.append(entity)
+    logger.info(f"Prepared {len(F1_2026_SCHEDULE)} F1 2026 races")
+
+    # Sync F1 2024 historical data
+    for race in F1_2024_SCHEDULE:
+        track_info = get_track_info("F1", race["circuit"])
+        entity = {
+            "PartitionKey": generate_partition_key("F1", race["date"]),
+            "RowKey": generate_row_key(race["date"], "F1", race["name"].replace(" ", "")),
+            "Series": "F1",
+            "RaceName": race["name"],
+            "Venue": race["circuit"],
+            "StartTime": race["date"],
+            "Network": race.get("network", "ESPN"),
+            "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+            "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+            "Odds_Data": "N/A",
+            "Polymarket_Prob": "N/A",
+            "Winner": race.get("winner", ""),
+            "Podium2": race.get("podium2", ""),
+            "Podium3": race.get("podium3", ""),
+            "Country": race.get("country", ""),
+        }
+        entities.append(entity)
+    logger.info(f"Prepared {len(F1_2024_SCHEDULE)} F1 2024 races")
+
+    # Sync NASCAR 2024 historical data
+    for race in NASCAR_2024_SCHEDULE:
+        track_info = get_track_info("NASCAR", race["circuit"])
+        entity = {
+            "PartitionKey": generate_partition_key("NASCAR", race["date"]),
+            "RowKey": generate_row_key(race["date"], "NASCAR", race["name"].replace(" ", "")),
+            "Series": "NASCAR",
+            "RaceName": race["name"],
+            "Venue": race["circuit"],
+            "StartTime": race["date"],
+            "Network": race.get("network", "FOX"),
+            "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+            "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+            "Odds_Data": "N/A",
+            "Polymarket_Prob": "N/A",
+            "Winner": race.get("winner", ""),
+            "Country": track_info.get("country", "USA") if track_info else "USA",
+        }
+        entities.append(entity)
+    logger.info(f"Prepared {len(NASCAR_2024_SCHEDULE)} NASCAR 2024 races")
+
+    # Sync IndyCar 2024 historical data
+    for race in INDYCAR_2024_SCHEDULE:
+        track_info = get_track_info("IndyCar", race["circuit"])
+        entity = {
+            "PartitionKey": generate_partition_key("IndyCar", race["date"]),
+            "RowKey": generate_row_key(race["date"], "IndyCar", race["name"].replace(" ", "")),
+            "Series": "IndyCar",
+            "RaceName": race["name"],
+            "Venue": race["circuit"],
+            "StartTime": race["date"],
+            "Network": race.get("network", "NBC"),
+            "Latitude": track_info.get("latitude", 0.0) if track_info else 0.0,
+            "Longitude": track_info.get("longitude", 0.0) if track_info else 0.0,
+            "Odds_Data": "N/A",
+            "Polymarket_Prob": "N/A",
+            "Winner": race.get("winner", ""),
+            "Country": track_info.get("country", "USA") if track_info else "USA",
+        }
+        entities.append(entity)
+    logger.info(f"Prepared {len(INDYCAR_2024_SCHEDULE)} IndyCar 2024 races")
+
+    return entities
 
-        await table_client.close()
-        logger.info("Data sync completed successfully!")
+
+@track_job("sync")
+async def sync_race_data():
+    """Main data sync function that runs every 24 hours."""
+    logger.info("Starting data sync...")
+    synced = False
+    sync_start = time.perf_counter()
+
+    try:
+        storage = await get_storage()
+        if not storage:
+            logger.warning("No storage backend - skipping sync")
+            return
+
+        # The FastF1 schedule and the static schedules are built side by side
+        logger.info("Fetching the FastF1 schedule and building the static schedules...")
+        f1_races, static_entities = await asyncio.gather(
+            timed("FastF1 schedule", fetch_f1_schedule(2025)),
+            timed("Static schedules", asyncio.to_thread(build_static_race_entities)),
+        )
+        podiums = await fetch_completed_f1_podiums(storage, 2025, f1_races)
+        entities = [build_f1_entity(race, podiums.get(race["round"], [])) for race in f1_races]
+        logger.info(f"Prepared {len(f1_races)} F1 races from FastF1")
+        entities.extend(static_entities)
+
+        if not f1_races:
+            # FastF1 returns nothing on errors - keep the stored F1 2025 season as it is
+            logger.warning("FastF1 returned no races - leaving stored F1 2025 races untouched")
+            if SYNC_MODE == "replace":
+                raise RuntimeError("no F1 schedule to replace the stored one with")
+
+        if SYNC_MODE == "replace":
+            # Clean up old entries, then rewrite everything as transactional batches
+            for series in RACE_SERIES:
+                logger.info(f"Cleaning up old {series} entries...")
+                await delete_series_entries(storage, series)
+
+            written = await submit_transaction_batches(
+                storage,
+                [("upsert", entity, {"mode": UpdateMode.MERGE}) for entity in entities],
+                label="race events",
+            )
+            logger.info(f"Data sync completed successfully! ({written}/{len(entities)} events written)")
+        else:
+            await reconcile_race_events(storage, entities)
+            logger.info("Data sync completed successfully!")
+
+        synced = True
 
     except Exception as e:
         logger.error(f"Data sync failed: {e}")
+        record_job_error()
 
+    write_pipeline.log_stats()
+    logger.info(f"Data sync took {time.perf_counter() - sync_start:.2f}s")
+    await refresh_race_store(save=synced)
 
+
+@track_job("odds")
 async def update_odds_data():
     """Scrape and update odds for upcoming F1 and NASCAR races."""
     logger.info("Starting odds update...")
+    updated = False
 
     try:
-        table_client = await get_async_table_client()
-        if not table_client:
-            logger.warning("No table client available - skipping odds update")
+        storage = await get_storage()
+        if not storage:
+            logger.warning("No storage backend available - skipping odds update")
             return
         now = datetime.now(timezone.utc)
 
-        # Get upcoming races (future races for each series)
-        all_races = []
-        async for entity in table_client.query_entities(
-            query_filter=f"PartitionKey eq '{PARTITION_KEY}'"
-        ):
-            start_time = entity.get("StartTime", "")
-            if start_time:
-                try:
-                    dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    # Get future races
-                    if dt > now:
-                        all_races.append(entity)
-                except Exception:
-                    pass
-
-        # Sort by date
-        all_races.sort(key=lambda r: r.get("StartTime", ""))
-
-        # Get next upcoming race for each series (limit to first 3 for odds)
+        # Get next upcoming races for each series (limit to first 3 for odds).
+        # Series picks the partitions and "from now on" is a RowKey range.
         races = []
         for series in ["F1", "NASCAR"]:
-            series_races = [r for r in all_races if r.get("Series") == series][:3]
-            races.extend(series_races)
+            series_races = await query_storage_race_events(
+                series=series, start=now, select=["PartitionKey", "RowKey", "Series", "RaceName"]
+            )
+            races.extend(series_races[:3])
 
         # Update odds for F1 and NASCAR races
         for series in ["F1", "NASCAR"]:
@@ -916,7 +1506,8 @@ async def update_odds_data():
 
             # Scrape odds from DraftKings
             logger.info(f"Scraping {series} odds from DraftKings...")
-            odds = await scrape_draftkings_odds(series, headless=True)
+            with external_call("DraftKings"):
+                odds = await scrape_draftkings_odds(series, headless=True)
 
             if odds and odds.drivers:
                 # Format top 3 favorites as string
@@ -927,49 +1518,131 @@ async def update_odds_data():
 
                 logger.info(f"{series} odds: {odds_str}")
 
-                # Update all upcoming races for this series - only send the fields we need
-                for race in series_races:
-                    # Only send minimal fields to update - MERGE mode will preserve other fields
-                    update_entity = {
+                # Update all upcoming races for this series - only send the fields we need.
+                # Only minimal fields are sent - MERGE mode will preserve other fields
+                await asyncio.gather(*(
+                    upsert_race_event(storage, {
                         "PartitionKey": race.get("PartitionKey"),
                         "RowKey": race.get("RowKey"),
                         "Odds_Data": odds_str
-                    }
-                    await upsert_race_event(table_client, update_entity, merge=True)
-                    logger.info(f"Updated odds for {race.get('RaceName')}")
+                    }, merge=True)
+                    for race in series_races
+                ))
+                logger.info(f"Updated odds for {len(series_races)} {series} races")
             else:
+                # The scraper reports failures as None / no drivers
+                record_external_error("DraftKings")
                 logger.warning(f"Could not get {series} odds from DraftKings")
 
-        await table_client.close()
         logger.info("Odds update completed!")
+        updated = True
 
     except Exception as e:
         logger.error(f"Odds update failed: {e}")
+        record_job_error()
 
+    write_pipeline.log_stats()
+    await refresh_race_store(save=updated)
 
-async def background_worker():
-    """Background worker that syncs data and odds every 24 hours."""
-    while True:
-        try:
-            await sync_race_data()
-        except Exception as e:
-            logger.error(f"Data sync error: {e}")
 
-        # Update odds after data sync
-        try:
-            await update_odds_data()
-        except Exception as e:
-            logger.error(f"Odds update error: {e}")
+@track_job("results")
+async def update_race_result(row_key: str) -> bool:
+    """
+    Fetch results for one finished F1 race and store its podium.
+    Returns True once the race has results (nothing left to poll for).
+    """
+    events = await race_store.get(load_race_events)
+    race = next((e for e in events if e.get("RowKey") == row_key), None)
+    if race is None or race.get("Winner"):
+        return True
+
+    start = datetime.fromisoformat(race["StartTime"].replace('Z', '+00:00'))
+    round_number = int(race.get("RoundNumber") or 0)
+    venue = race.get("Venue", "")
+    logger.info(f"Polling results for {race.get('RaceName')} ({row_key})...")
+
+    # FastF1 needs the round number; races from the static schedules are looked
+    # up on OpenF1 by its location name - their Venue is the full circuit name
+    if round_number > 0:
+        results = await fetch_f1_race_results(start.year, round_number, venue)
+    else:
+        results = await fetch_openf1_race_results(start.year, race.get("Location") or venue)
 
-        # Sync F1 standings
-        try:
-            await sync_f1_standings_to_storage()
-        except Exception as e:
-            logger.error(f"F1 standings sync error: {e}")
+    podium = (results or {}).get("podium") or []
+    if not podium:
+        return False
+
+    storage = await get_storage()
+    if not storage:
+        return False
+
+    if round_number > 0:
+        # Provisional for now - the daily sync re-checks it until it's final
+        await save_race_results(storage, [
+            build_results_entity(start.year, round_number, race.get("RaceName", ""), start, podium)
+        ])
+
+    await upsert_race_event(storage, {
+        "PartitionKey": race["PartitionKey"],
+        "RowKey": row_key,
+        "Winner": podium[0]["full_name"],
+        "Podium2": podium[1]["full_name"] if len(podium) > 1 else "",
+        "Podium3": podium[2]["full_name"] if len(podium) > 2 else "",
+    }, merge=True)
+    logger.info(f"Results: 1st {podium[0]['full_name']} at {race.get('RaceName')}")
+
+    await refresh_race_store()
+    return True
+
+
+async def pending_result_races() -> list[tuple[str, datetime]]:
+    """
+    F1 races without results that finish between a day ago and the next
+    daily sync - (RowKey, StartTime) pairs for the results polls.
+    """
+    index = await get_race_index()
+    now = datetime.now(timezone.utc)
+    window = index.between(
+        now - timedelta(days=1) - RESULTS_DELAY,
+        now + timedelta(hours=DATA_SYNC_INTERVAL_HOURS),
+        series="F1",
+    )
+    return [(race["RowKey"], race["start"]) for race in window if not race.get("Winner")]
 
-        # Sleep for 24 hours
-        logger.info(f"Next sync in {DATA_SYNC_INTERVAL_HOURS} hours...")
-        await asyncio.sleep(DATA_SYNC_INTERVAL_HOURS * 3600)
+
+async def next_race_start() -> Optional[datetime]:
+    """Start time of the next race on the calendar."""
+    index = await get_race_index()
+    return index.next_start(datetime.now(timezone.utc))
+
+
+# Background jobs: daily schedule sync, adaptive odds, standings and results polls
+race_scheduler = RaceJobScheduler(
+    sync=sync_race_data,
+    odds=update_odds_data,
+    standings=sync_f1_standings_to_storage,
+    results=update_race_result,
+    pending_results=pending_result_races,
+    next_race_start=next_race_start,
+    sync_interval_hours=DATA_SYNC_INTERVAL_HOURS,
+)
+
+
+def create_leader_lock() -> LeaderLock:
+    if LEADER_LOCK == "storage":
+        return StorageLeaseLock(get_storage, owner=process_id(), duration_seconds=LEADER_LEASE_SECONDS)
+    if LEADER_LOCK == "none":
+        return NoLeaderLock()
+    return FileLeaderLock(LEADER_LOCK_PATH)
+
+
+# Renews well inside the lease, so a healthy leader never loses it
+leader_election = LeaderElection(
+    create_leader_lock(),
+    on_elected=race_scheduler.start,
+    on_demoted=race_scheduler.stop,
+    interval_seconds=LEADER_LEASE_SECONDS / 3,
+)
 
 
 # =============================================================================
@@ -984,14 +1657,17 @@ async def fetch_news() -> list[dict]:
     if news_cache["timestamp"]:
         cache_age = datetime.now(timezone.utc) - news_cache["timestamp"]
         if cache_age.total_seconds() < NEWS_CACHE_TTL_MINUTES * 60:
+            record_cache("news", True)
             return news_cache["data"]
+    record_cache("news", False)
 
     news_items = []
 
     async with httpx.AsyncClient() as client:
         for source, url in RSS_FEEDS.items():
             try:
-                response = await client.get(url, timeout=10.0, follow_redirects=True)
+                with external_call("RSS"):
+                    response = await client.get(url, timeout=10.0, follow_redirects=True)
                 feed = feedparser.parse(response.text)
 
                 for entry in feed.entries[:5]:  # Top 5 from each source
@@ -1022,19 +1698,39 @@ async def fetch_news() -> list[dict]:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan - start background worker on startup."""
-    # Start background data sync worker
-    task = asyncio.create_task(background_worker())
-    logger.info("Started background data sync worker")
+    """Application lifespan - warm start from snapshot, connect to storage and start background jobs."""
+    precompile_templates()
+    await restore_race_snapshot()
+    await init_storage()
+
+    # The elected worker runs the background jobs; every worker follows its
+    # data updates and pushes live status to its own SSE clients
+    tasks = [
+        asyncio.create_task(follow_data_updates()),
+        asyncio.create_task(race_status_watcher()),
+    ]
+    if RUN_BACKGROUND_JOBS:
+        await leader_election.check()
+        tasks.append(asyncio.create_task(leader_election.run()))
+    else:
+        logger.info("Background jobs disabled - expecting a separate worker process")
 
     yield
 
     # Cleanup
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await leader_election.resign()
+    # Let cancelled jobs unwind before closing what they write through
+    await race_scheduler.wait_stopped()
+
+    await write_pipeline.close()
+    await close_storage()
 
 
 app = FastAPI(
@@ -1044,48 +1740,307 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Templates
-templates = Jinja2Templates(directory="templates")
+
+class BrotliResponder(GZipResponder):
+    """Starlette's gzip responder with its compressor swapped for brotli."""
+
+    def __init__(self, app, minimum_size: int):
+        super().__init__(app, minimum_size)
+        # GzipFile has already written its header into the parent's buffer
+        self.gzip_buffer = io.BytesIO()
+        self.gzip_file = BrotliWriter(self.gzip_buffer)
+
+    async def __call__(self, scope, receive, send) -> None:
+        async def send_brotli(message) -> None:
+            # The parent labels what it compressed "gzip"; responses that came
+            # with their own Content-Encoding (cached pages) pass through as-is
+            if message["type"] == "http.response.start" and not self.content_encoding_set:
+                headers = MutableHeaders(raw=message["headers"])
+                if headers.get("content-encoding") == "gzip":
+                    headers["Content-Encoding"] = "br"
+            await send(message)
+
+        await super().__call__(scope, receive, send_brotli)
+
+
+class StreamingCompressionMiddleware(GZipMiddleware):
+    """
+    Compresses uncached responses in the encoding choose_encoding() picks
+    (br, then gzip), like the cached path. Leaves Server-Sent Events alone
+    (compressing would buffer them) and honours q=0 in Accept-Encoding,
+    which Starlette ignores.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None or b"text/event-stream" in headers.get(b"accept", b""):
+            await self.app(scope, receive, send)
+        elif encoding == "br":
+            await BrotliResponder(self.app, self.minimum_size)(scope, receive, send)
+        else:
+            await GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)(scope, receive, send)
+
+
+# Compress uncached responses (API JSON/NDJSON, sitemap) per request. Cached
+# pages and feeds are served precompressed and already carry Content-Encoding,
+# which this middleware leaves alone.
+app.add_middleware(StreamingCompressionMiddleware, minimum_size=COMPRESS_MIN_SIZE, compresslevel=6)
+
+# Per-route request latency for /metrics (outermost, so it includes compression)
+app.add_middleware(RequestMetricsMiddleware)
+
+# Templates - compiled bytecode is cached on disk so restarts skip recompiling
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR", "data/jinja_cache")
+
+
+def create_bytecode_cache(directory: str) -> Optional[FileSystemBytecodeCache]:
+    """On-disk Jinja2 bytecode cache, or None if the directory can't be created."""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        return FileSystemBytecodeCache(directory)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled ({directory}): {e}")
+        return None
+
+
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=True,
+    bytecode_cache=create_bytecode_cache(TEMPLATE_CACHE_DIR),
+    # Templates only change on deploy - skip the per-render mtime check outside development
+    auto_reload=os.getenv("ENV", "production") == "development",
+))
 
 # Add custom template filters
-templates.env.filters["format_race_time"] = format_race_time
 templates.env.filters["series_logo"] = get_series_logo
 templates.env.filters["series_color"] = get_series_color
 
 
+
+def precompile_templates() -> int:
+    """
+    Compile every template up front (loading bytecode from the on-disk cache
+    when it's there), so the first request after a deploy renders as fast
+    as every later one. Returns the number of templates compiled.
+    """
+    start = time.perf_counter()
+    compiled = 0
+    for name in templates.env.list_templates(extensions=["html"]):
+        try:
+            templates.env.get_template(name)
+            compiled += 1
+        except Exception as e:
+            logger.error(f"Failed to compile template {name}: {e}")
+
+    logger.info(f"Precompiled {compiled} templates in {(time.perf_counter() - start) * 1000:.0f}ms")
+    return compiled
+
+
+# =============================================================================
+# RENDERED PAGE CACHE
+# =============================================================================
+
+def page_cache_key(request: Request, *parts) -> tuple:
+    """
+    Cache key for a rendered page: route, the query params the route declares
+    (sorted), data version, plus any extra `parts` the page depends on (e.g.
+    which races are in its time window), so the key changes exactly when the
+    HTML would. Unknown params are dropped, so `?x=<random>` can't force a
+    fresh render on every request.
+    """
+    route = request.scope.get("route")
+    dependant = getattr(route, "dependant", None)
+    declared = {param.alias for param in dependant.query_params} if dependant else set()
+    params = tuple(sorted((k, v) for k, v in request.query_params.multi_items() if k in declared))
+    return (request.url.path, params, race_store.version, *parts)
+
+
+def race_window_key(races: list[dict]) -> tuple:
+    """
+    Identify a time-window selection from the race index. Windows are
+    contiguous runs of the sorted index, so the first race and the count pin
+    one down within a data version.
+    """
+    return (len(races), races[0].get("RowKey") if races else None)
+
+
+def news_cache_epoch() -> int:
+    """Bucket number of the news TTL, so pages showing news are re-rendered when it expires."""
+    return int(time.time() // (NEWS_CACHE_TTL_MINUTES * 60))
+
+
+async def cached_entry_response(request: Request, entry: CachedResponse) -> Response:
+    """
+    Serve a cached body - compressed if the client accepts gzip/brotli, using
+    the entry's stored encoding - or 304 Not Modified if the client already has it.
+    The first compression of an entry runs in a thread, off the event loop.
+    """
+    encoding = None
+    if len(entry.body) >= COMPRESS_MIN_SIZE:
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+
+    etag = entry.encoded_etag(encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=0, must-revalidate",
+        "Vary": "Accept-Encoding",
+        **entry.headers,
+    }
+    # If-None-Match takes precedence; If-Modified-Since only applies without it.
+    # Any encoding of the same body is still a valid copy for the client.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = any(
+            etag_matches(if_none_match, entry.encoded_etag(e)) for e in (None, "gzip", "br")
+        )
+    else:
+        not_modified = not_modified_since(request.headers.get("if-modified-since"), entry.headers.get("Last-Modified"))
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        body = entry.encoded.get(encoding)
+        if body is None:
+            loop = asyncio.get_running_loop()
+            body = await loop.run_in_executor(None, entry.encoded_body, encoding)
+        return Response(content=body, media_type=entry.media_type, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+async def cached_page_response(request: Request, key: tuple) -> Optional[Response]:
+    """Return the cached response for `key`, if there is a fresh one."""
+    entry = render_cache.get(key)
+    record_cache("page", entry is not None)
+    return await cached_entry_response(request, entry) if entry else None
+
+
+async def render_page(request: Request, key: tuple, template: str, context: dict, cache: bool = True) -> Response:
+    """
+    Render a template, store it in the page cache and serve it with an ETag.
+    With cache=False (e.g. the race data couldn't be loaded) the page is
+    served once and not stored, so it can't outlive the outage.
+    """
+    response = templates.TemplateResponse(template, context)
+    if not cache:
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    entry = render_cache.put(key, response.body, response.media_type)
+    return await cached_entry_response(request, entry)
+
+
+def race_index_cacheable(index: RaceIndex) -> bool:
+    """Whether output built from `index` may be cached - not when the load failed and left it empty."""
+    return race_store.is_loaded and len(index) > 0
+
+
+# =============================================================================
+# LIVE UPDATES (SERVER-SENT EVENTS)
+# =============================================================================
+
+# How long a race shows as LIVE after its start - matches the browser's badge logic
+RACE_LIVE_WINDOW = timedelta(hours=2)
+SSE_KEEPALIVE_SECONDS = 15
+# Uvicorn waits for open responses before shutting down, and SSE streams
+# only end when the client leaves - bound the wait (clients reconnect)
+SSE_SHUTDOWN_TIMEOUT_SECONDS = 10
+
+
+def publish_race_changes(previous: Optional[RaceIndex], current: Optional[RaceIndex]) -> int:
+    """
+    Push odds and result changes between two data versions to SSE clients,
+    as rendered fragments for the matching sse-swap targets on race cards.
+    """
+    if not live_updates.subscriber_count or previous is None or current is None:
+        return 0
+
+    before = {race.get("RowKey"): race for race in previous.races}
+    odds_template = templates.env.get_template("partials/race_odds.html")
+    result_template = templates.env.get_template("partials/race_result.html")
+
+    sent = 0
+    for race in current.races:
+        old = before.get(race.get("RowKey"))
+        if old is None:
+            continue
+        if any(old.get(field) != race.get(field) for field in ODDS_FIELDS):
+            live_updates.publish(f"odds-{race['RowKey']}", odds_template.render(race=race))
+            sent += 1
+        if any(old.get(field) != race.get(field) for field in RESULT_FIELDS):
+            live_updates.publish(f"result-{race['RowKey']}", result_template.render(race=race))
+            sent += 1
+
+    if sent:
+        logger.info(f"Pushed {sent} race updates to {live_updates.subscriber_count} live clients")
+    return sent
+
+
+def publish_status_changes(index: RaceIndex, since: datetime, now: datetime) -> int:
+    """Push LIVE / Completed badges for races that started or finished in (since, now]."""
+    if not live_updates.subscriber_count:
+        return 0
+
+    status_template = templates.env.get_template("partials/race_status.html")
+    changes = [(race, "live") for race in index.between(since, now)]
+    changes += [(race, "completed") for race in index.between(since - RACE_LIVE_WINDOW, now - RACE_LIVE_WINDOW)]
+    for race, state in changes:
+        live_updates.publish(f"status-{race['RowKey']}", status_template.render(race=race, state=state))
+    return len(changes)
+
+
+async def race_status_watcher():
+    """
+    Sleep until the next race starts or finishes (per the time index), then
+    push its new status. Wakes at least hourly to pick up synced schedules.
+    """
+    since = datetime.now(timezone.utc)
+    while True:
+        try:
+            index = await get_race_index()
+            now = datetime.now(timezone.utc)
+            changes = [index.next_start(now), index.next_start(now - RACE_LIVE_WINDOW)]
+            if changes[1] is not None:
+                changes[1] += RACE_LIVE_WINDOW
+            next_change = min((c for c in changes if c is not None), default=None)
+
+            delay = 3600.0
+            if next_change is not None:
+                delay = min(delay, max(1.0, (next_change - now).total_seconds()))
+            await asyncio.sleep(delay)
+
+            now = datetime.now(timezone.utc)
+            publish_status_changes(await get_race_index(), since, now)
+            since = now
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Race status watcher error: {e}")
+            await asyncio.sleep(60)
+
+
 # =============================================================================
 # ROUTES
 # =============================================================================
 
+# Routes render the precomputed race views from the time index (race_views.py)
+
 @app.get("/", response_class=HTMLResponse)
 async def homepage(request: Request):
     """Render the main homepage."""
-    # Get all race events
-    races = await query_race_events()
-
-    # Enrich with formatted time
-    for race in races:
-        race["time_info"] = format_race_time(race.get("StartTime", ""))
-
-    # Filter upcoming races (this week only) and past races
+    # Upcoming races (this week only) and the last 3 completed, via the time index
+    index = await get_race_index()
     now = datetime.now(timezone.utc)
-    one_week_later = now + timedelta(days=7)
-    upcoming = []
-    past = []
+    upcoming = index.upcoming(now, now + timedelta(days=7))[:20]
+    past = index.past(now, limit=3)
 
-    for race in races:
-        try:
-            race_time = datetime.fromisoformat(race.get("StartTime", "").replace('Z', '+00:00'))
-            if race_time > now and race_time <= one_week_later:
-                # Only include races within the next 7 days
-                upcoming.append(race)
-            elif race_time <= now:
-                past.append(race)
-        except Exception:
-            continue
-
-    # Sort past races by date descending (most recent first)
-    past.sort(key=lambda x: x.get("StartTime", ""), reverse=True)
+    key = page_cache_key(request, race_window_key(upcoming), race_window_key(past), news_cache_epoch())
+    if cached := await cached_page_response(request, key):
+        return cached
 
     # Fetch news and F1 standings concurrently
     current_year = datetime.now().year
@@ -1098,73 +2053,42 @@ async def homepage(request: Request):
     if not f1_standings.get("drivers"):
         f1_standings = await fetch_f1_standings(current_year)
 
-    return templates.TemplateResponse(
+    return await render_page(
+        request,
+        key,
         "index.html",
         {
             "request": request,
-            "upcoming_races": upcoming[:20],
-            "past_races": past[:3],  # Show last 3 completed races by default
+            "upcoming_races": upcoming,
+            "past_races": past,  # Show last 3 completed races by default
             "news": news,
             "f1_standings": f1_standings,
             "series_list": ["F1", "NASCAR", "IndyCar"],
             "current_filter": "all",
-        }
+        },
+        cache=race_index_cacheable(index),
     )
 
 
 @app.get("/calendar", response_class=HTMLResponse)
 async def calendar_page(request: Request, year: Optional[int] = None, series: Optional[str] = None):
     """Render the full calendar page for 2025/2026."""
-    from collections import defaultdict
-
-    # Get all race events
-    races = await query_race_events()
-
-    # Enrich with formatted time
-    for race in races:
-        race["time_info"] = format_race_time(race.get("StartTime", ""))
-
-    # Filter by series if specified
-    if series and series.lower() != "all":
-        races = [r for r in races if r.get("Series", "").lower() == series.lower()]
-
-    # Filter by year if specified
-    if year:
-        races = [r for r in races if str(year) in r.get("StartTime", "")]
-
-    # Sort races by date
-    races.sort(key=lambda x: x.get("StartTime", ""))
-
-    # Group races by month
-    races_by_month = defaultdict(list)
-    for race in races:
-        try:
-            race_time = datetime.fromisoformat(race.get("StartTime", "").replace('Z', '+00:00'))
-            month_key = race_time.strftime("%Y-%m")
-            month_name = race_time.strftime("%B %Y")
-            race["month_name"] = month_name
-            race["day"] = race_time.strftime("%d")
-            race["weekday"] = race_time.strftime("%a")
-            races_by_month[month_key].append(race)
-        except Exception:
-            continue
-
-    # Convert to sorted list of (month_key, month_name, races) tuples
-    months = []
-    for month_key in sorted(races_by_month.keys()):
-        month_races = races_by_month[month_key]
-        if month_races:
-            months.append({
-                "key": month_key,
-                "name": month_races[0]["month_name"],
-                "races": month_races
-            })
-
-    # Get current month key for auto-scroll
+    # The current month only moves the auto-scroll target
     now = datetime.now(timezone.utc)
     current_month_key = now.strftime("%Y-%m")
 
-    return templates.TemplateResponse(
+    # Load the index first so the key carries the version it was built from
+    index = await get_race_index()
+    key = page_cache_key(request, current_month_key)
+    if cached := await cached_page_response(request, key):
+        return cached
+
+    # Races by series and year, already grouped by month in the index
+    months = index.months(year or None, series=series)
+
+    return await render_page(
+        request,
+        key,
         "calendar.html",
         {
             "request": request,
@@ -1173,56 +2097,44 @@ async def calendar_page(request: Request, year: Optional[int] = None, series: Op
             "selected_series": series or "all",
             "years": [2024, 2025, 2026],
             "series_list": ["F1", "NASCAR", "IndyCar"],
-            "total_races": len(races),
+            "total_races": sum(len(month["races"]) for month in months),
             "current_month_key": current_month_key,
-        }
+        },
+        cache=race_index_cacheable(index),
     )
 
 
 @app.get("/filter/{series}", response_class=HTMLResponse)
 async def filter_races(request: Request, series: str):
     """HTMX endpoint to filter races by series."""
-    if series.lower() == "all":
-        races = await query_race_events()
-    else:
-        races = await query_race_events(series_filter=series)
-
-    # Enrich with formatted time
-    for race in races:
-        race["time_info"] = format_race_time(race.get("StartTime", ""))
-
-    # Filter to upcoming races (this week only - matching homepage behavior)
+    # Upcoming races (this week only - matching homepage behavior)
+    index = await get_race_index()
     now = datetime.now(timezone.utc)
-    one_week_later = now + timedelta(days=7)
-    upcoming = []
+    upcoming = index.upcoming(now, now + timedelta(days=7), series=series)[:20]
 
-    for race in races:
-        try:
-            race_time = datetime.fromisoformat(race.get("StartTime", "").replace('Z', '+00:00'))
-            if race_time > now and race_time <= one_week_later:
-                upcoming.append(race)
-        except Exception:
-            continue
+    key = page_cache_key(request, race_window_key(upcoming))
+    if cached := await cached_page_response(request, key):
+        return cached
 
-    return templates.TemplateResponse(
+    return await render_page(
+        request,
+        key,
         "partials/race_card.html",
         {
             "request": request,
-            "races": upcoming[:20],
-        }
+            "races": upcoming,
+        },
+        cache=race_index_cacheable(index),
     )
 
 
-@app.get("/calendar.ics")
-async def generate_calendar():
-    """Generate iCal file for download."""
-    races = await query_race_events()
-
+def serialize_calendar(races: list[dict]) -> bytes:
+    """Build and serialize an iCal feed (slow - done once per data version and filter)."""
     cal = Calendar()
 
     for race in races:
         try:
-            event = Event()
+            event = Event(uid=f"{race.get('RowKey', '')}@racecentral")  # stable across syncs
             event.name = f"{race.get('Series', '')} - {race.get('RaceName', 'Race')}"
             event.begin = race.get("StartTime", "")
             event.duration = timedelta(hours=3)  # Assume 3-hour race
@@ -1232,87 +2144,190 @@ async def generate_calendar():
         except Exception as e:
             logger.error(f"Failed to add event to calendar: {e}")
 
-    return Response(
-        content=cal.serialize(),
-        media_type="text/calendar",
-        headers={"Content-Disposition": "attachment; filename=racecentral.ics"}
-    )
+    return cal.serialize().encode()
+
+
+@app.get("/calendar.ics")
+async def generate_calendar(request: Request, series: Optional[str] = None, year: Optional[int] = None):
+    """Generate iCal file for download (optionally one series and/or season)."""
+    series_key = (series or "all").lower()
+    # Load the index first so the key carries the version it was built from
+    index = await get_race_index()
+    key = ("/calendar.ics", series_key, year, race_store.version)
+    if cached := await cached_page_response(request, key):
+        return cached
+
+    races = index.all(series_key) if year is None else index.season(year, series_key)
+
+    loop = asyncio.get_running_loop()
+    body = await loop.run_in_executor(None, serialize_calendar, races)
+
+    # Name filtered feeds after the stored series name, never the raw query value
+    filename = "racecentral"
+    if series_key != "all" and races:
+        filename += f"-{races[0]['Series'].lower()}"
+    if year is not None:
+        filename += f"-{year}"
+    headers = {"Content-Disposition": f"attachment; filename={filename}.ics"}
+    if race_store.loaded_at:
+        headers["Last-Modified"] = http_date(race_store.loaded_at)
+
+    # A feed from a failed load would make subscribed calendars drop every event
+    if not race_index_cacheable(index):
+        headers["Cache-Control"] = "no-store"
+        return Response(content=body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+    entry = render_cache.put(key, body, "text/calendar; charset=utf-8", headers)
+    return await cached_entry_response(request, entry)
+
+
+# /api/races paging: largest page a client may ask for, and rows per streamed chunk
+API_MAX_PAGE_SIZE = 1000
+NDJSON_CHUNK_SIZE = 100
+
+
+def parse_api_time(value: Optional[str], end_of_day: bool = False) -> Optional[datetime]:
+    """
+    Parse a from/to query value ("2025-03-01" or a full ISO datetime) as UTC.
+    A bare date used as an end bound covers that whole day.
+    """
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    # RowKeys are UTC wall time - convert offsets like +05:00 before building ranges
+    dt = dt.astimezone(timezone.utc)
+    if end_of_day and len(value) == 10:
+        dt += timedelta(days=1, minutes=-1)
+    return dt
+
+
+async def stream_ndjson(races: list[dict], select: Optional[list[str]]):
+    """Yield races as newline-delimited JSON, a chunk of rows at a time."""
+    for start in range(0, len(races), NDJSON_CHUNK_SIZE):
+        chunk = project_races(races[start:start + NDJSON_CHUNK_SIZE], select)
+        yield b"".join(fast_json.dumps(race) + b"\n" for race in chunk)
 
 
 @app.get("/api/races")
-async def api_races(series: Optional[str] = None):
-    """JSON API endpoint for race data."""
-    if series:
-        races = await query_race_events(series_filter=series)
-    else:
-        races = await query_race_events()
+async def api_races(
+    request: Request,
+    series: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=API_MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = None,
+    format: Optional[str] = None,
+):
+    """
+    JSON API endpoint for race data, in start time order.
 
-    return {"races": races}
+    - cursor/limit: page through races; pass back `next_cursor` (also sent
+      as the X-Next-Cursor header) to get the next page
+    - fields: comma-separated fields to return, e.g. fields=RaceName,StartTime
+    - from/to: only races starting in this window (dates or ISO datetimes)
+    - format=ndjson (or Accept: application/x-ndjson): stream one race per line
+    """
+    try:
+        lower, upper = row_key_range(parse_api_time(from_), parse_api_time(to, end_of_day=True))
+    except ValueError:
+        return JSONResponse(status_code=400, content={"error": "from/to must be ISO dates or datetimes"})
 
+    select = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
 
-@app.get("/past-races", response_class=HTMLResponse)
-async def past_races_page(request: Request):
-    """HTMX endpoint to load all past races with results."""
-    races = await query_race_events()
+    races, next_cursor = await query_race_page(series, lower, upper, cursor, limit)
 
-    # Enrich with formatted time
-    for race in races:
-        race["time_info"] = format_race_time(race.get("StartTime", ""))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
 
-    # Filter to past races only
-    now = datetime.now(timezone.utc)
-    past = []
+    if format == "ndjson" or "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(stream_ndjson(races, select), media_type="application/x-ndjson", headers=headers)
 
-    for race in races:
-        try:
-            race_time = datetime.fromisoformat(race.get("StartTime", "").replace('Z', '+00:00'))
-            if race_time <= now:
-                past.append(race)
-        except Exception:
-            continue
+    body = fast_json.dumps({"races": project_races(races, select), "next_cursor": next_cursor})
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Past race cards per /past-races page (the sentinel loads the next one)
+PAST_RACES_PAGE_SIZE = 12
+
+
+@app.get("/past-races", response_class=HTMLResponse)
+async def past_races_page(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(PAST_RACES_PAGE_SIZE, ge=1, le=100),
+):
+    """
+    HTMX endpoint to load past races with results, one page at a time.
+    Each page ends with a sentinel that fetches the next one when scrolled
+    into view; `cursor` is the RowKey of the last race already shown.
+    """
+    # One page of past races, most recent first - fetch one extra to know if there's more
+    index = await get_race_index()
+    window = index.past(datetime.now(timezone.utc), limit=limit + 1, before=cursor)
+
+    key = page_cache_key(request, race_window_key(window))
+    if cached := await cached_page_response(request, key):
+        return cached
 
-    # Sort by date descending (most recent first)
-    past.sort(key=lambda x: x.get("StartTime", ""), reverse=True)
+    past = window[:limit]
+    next_cursor = past[-1].get("RowKey") if len(window) > limit else None
 
-    return templates.TemplateResponse(
+    return await render_page(
+        request,
+        key,
         "partials/past_races.html",
         {
             "request": request,
             "races": past,
-        }
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+            "limit": limit,
+        },
+        cache=race_index_cacheable(index),
     )
 
 
 @app.get("/recent-races", response_class=HTMLResponse)
 async def recent_races_page(request: Request):
     """HTMX endpoint to load only recent past races (last 3)."""
-    races = await query_race_events()
-
-    # Enrich with formatted time
-    for race in races:
-        race["time_info"] = format_race_time(race.get("StartTime", ""))
+    # Last 3 past races, most recent first
+    index = await get_race_index()
+    past = index.past(datetime.now(timezone.utc), limit=3)
 
-    # Filter to past races only
-    now = datetime.now(timezone.utc)
-    past = []
+    key = page_cache_key(request, race_window_key(past))
+    if cached := await cached_page_response(request, key):
+        return cached
 
-    for race in races:
-        try:
-            race_time = datetime.fromisoformat(race.get("StartTime", "").replace('Z', '+00:00'))
-            if race_time <= now:
-                past.append(race)
-        except Exception:
-            continue
-
-    # Sort by date descending (most recent first) and limit to 3
-    past.sort(key=lambda x: x.get("StartTime", ""), reverse=True)
-
-    return templates.TemplateResponse(
+    return await render_page(
+        request,
+        key,
         "partials/past_races.html",
         {
             "request": request,
-            "races": past[:3],
-        }
+            "races": past,
+        },
+        cache=race_index_cacheable(index),
+    )
+
+
+@app.get("/events")
+async def live_events(request: Request):
+    """Server-Sent Events stream of per-race updates (odds, results, LIVE status) for HTMX to swap in."""
+    async def stream():
+        with live_updates.subscribe() as queue:
+            yield "retry: 10000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -1371,6 +2386,13 @@ async def health_check():
     return {"status": "healthy", "version": "2.0.0"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics: job runs, storage writes, external calls, caches and request latency."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.post("/update-odds")
 async def trigger_odds_update():
     """Manually trigger odds update from DraftKings."""
@@ -1392,5 +2414,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", 8000)),
-        reload=os.getenv("ENV", "production") == "development"
+        reload=os.getenv("ENV", "production") == "development",
+        # Don't let open SSE streams hold up shutdown
+        timeout_graceful_shutdown=SSE_SHUTDOWN_TIMEOUT_SECONDS,
     )
@@ -0,0 +1,170 @@
+"""
+RaceCentral 2.0 - Prometheus Metrics
+Job durations, storage writes, external API latency, cache hit rates and
+per-route request latency, exposed on /metrics.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty
+directory so /metrics aggregates every worker instead of the one that
+happened to answer the scrape. prometheus_client reads it once, on import,
+so it must be set (or .env loaded) before this module is imported.
+"""
+
+import functools
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# prometheus_client turns on multiprocess mode if the variable merely exists,
+# so an empty "PROMETHEUS_MULTIPROC_DIR=" line in .env would make it write
+# counter_<pid>.db files into the working directory. Treat empty as unset.
+for _name in ("PROMETHEUS_MULTIPROC_DIR", "prometheus_multiproc_dir"):
+    if not os.environ.get(_name, "x"):
+        del os.environ[_name]
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import REGISTRY, multiprocess
+
+# Fixed on import, with the same check prometheus_client uses to pick its value storage
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ or "prometheus_multiproc_dir" in os.environ
+
+JOB_DURATION = Histogram(
+    "racecentral_job_duration_seconds",
+    "Background job run time",
+    ["job"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+JOB_RUNS = Counter("racecentral_job_runs_total", "Background job runs", ["job", "status"])
+
+STORAGE_WRITES = Counter(
+    "racecentral_storage_writes_total",
+    "Entities written to storage, by operation (upsert, delete)",
+    ["operation"],
+)
+SYNC_CHANGES = Counter(
+    "racecentral_sync_changes_total",
+    "Race events changed by schedule syncs (inserted, updated, deleted, unchanged)",
+    ["change"],
+)
+
+EXTERNAL_LATENCY = Histogram(
+    "racecentral_external_request_duration_seconds",
+    "External data source call time (FastF1, OpenF1, Jolpica, RSS, DraftKings)",
+    ["source"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+EXTERNAL_ERRORS = Counter("racecentral_external_request_errors_total", "Failed external calls", ["source"])
+
+CACHE_REQUESTS = Counter("racecentral_cache_requests_total", "Cache lookups", ["cache", "result"])
+
+REQUEST_LATENCY = Histogram(
+    "racecentral_http_request_duration_seconds",
+    "HTTP request time until the response starts, by route template",
+    ["method", "route", "status"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+# Outcome of the tracked job running in the current context
+_job_outcome: ContextVar[Optional[dict]] = ContextVar("job_outcome", default=None)
+
+
+def track_job(name: str):
+    """
+    Decorator recording an async job's duration and outcome. A run fails if
+    the job raises or calls record_job_error() - the jobs log and swallow
+    their own errors, so they report failures that way.
+    """
+    def decorator(job):
+        @functools.wraps(job)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = {"error": False}
+            token = _job_outcome.set(outcome)
+            try:
+                return await job(*args, **kwargs)
+            except BaseException:
+                outcome["error"] = True
+                raise
+            finally:
+                _job_outcome.reset(token)
+                JOB_DURATION.labels(name).observe(time.perf_counter() - start)
+                JOB_RUNS.labels(name, "error" if outcome["error"] else "success").inc()
+        return wrapper
+    return decorator
+
+
+def record_job_error() -> None:
+    """Mark the tracked job running in this context as failed."""
+    outcome = _job_outcome.get()
+    if outcome is not None:
+        outcome["error"] = True
+
+
+@contextmanager
+def external_call(source: str) -> Iterator[None]:
+    """Time one call to an external data source; exceptions count as errors."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EXTERNAL_ERRORS.labels(source).inc()
+        raise
+    finally:
+        EXTERNAL_LATENCY.labels(source).observe(time.perf_counter() - start)
+
+
+def record_external_error(source: str) -> None:
+    """Count a failed external call whose client reports errors as empty results."""
+    EXTERNAL_ERRORS.labels(source).inc()
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware timing each request until its response starts, labelled
+    with the matched route template ("/filter/{series}") so paths with
+    parameters don't each get their own series. For streams (SSE, NDJSON)
+    this is time to first byte.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_timed(message) -> None:
+            if message["type"] == "http.response.start":
+                route = scope.get("route")
+                REQUEST_LATENCY.labels(
+                    scope["method"],
+                    getattr(route, "path", "unmatched"),
+                    str(message["status"]),
+                ).observe(time.perf_counter() - start)
+            await send(message)
+
+        await self.app(scope, receive, send_timed)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The text exposition of every metric, and its content type."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
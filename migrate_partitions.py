@@ -0,0 +1,83 @@
+"""
+RaceCentral 2.0 - Partition Layout Migration
+One-shot move of race events from the legacy single partition ("Season_2025")
+to one partition per series and season ("F1_2025", "NASCAR_2026", ...).
+
+Usage:
+    python -m migrate_partitions            # copy rows, then delete the legacy partition
+    python -m migrate_partitions --dry-run  # only report what would move
+    python -m migrate_partitions --keep-legacy
+"""
+
+import argparse
+import asyncio
+import logging
+
+from azure.data.tables import UpdateMode
+
+from main import (
+    LEGACY_PARTITION_KEY,
+    close_storage,
+    get_storage,
+    submit_transaction_batches,
+    write_pipeline,
+)
+from utils import generate_partition_key
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate_partitions(dry_run: bool = False, keep_legacy: bool = False) -> int:
+    """Copy every legacy race event into its series/season partition."""
+    storage = await get_storage()
+    if not storage:
+        logger.error("No storage backend - nothing to migrate")
+        return 0
+
+    legacy_entities = await storage.query_entities(LEGACY_PARTITION_KEY)
+    logger.info(f"Found {len(legacy_entities)} entities in {LEGACY_PARTITION_KEY}")
+
+    upserts = []
+    partitions: dict[str, int] = {}
+    for entity in legacy_entities:
+        partition_key = generate_partition_key(entity.get("Series", ""), entity.get("StartTime", ""))
+        partitions[partition_key] = partitions.get(partition_key, 0) + 1
+        upserts.append(("upsert", {**entity, "PartitionKey": partition_key}, {"mode": UpdateMode.REPLACE}))
+
+    for partition_key, count in sorted(partitions.items()):
+        logger.info(f"  {partition_key}: {count} entities")
+
+    if dry_run:
+        logger.info("Dry run - no changes written")
+        return 0
+
+    migrated = await submit_transaction_batches(storage, upserts, label="migrated events")
+
+    if keep_legacy:
+        logger.info(f"Keeping legacy partition {LEGACY_PARTITION_KEY}")
+    elif migrated == len(upserts):
+        deletes = [
+            ("delete", {"PartitionKey": LEGACY_PARTITION_KEY, "RowKey": entity["RowKey"]})
+            for entity in legacy_entities
+        ]
+        await submit_transaction_batches(storage, deletes, label="legacy deletes")
+    else:
+        logger.warning("Some entities failed to migrate - legacy partition left in place")
+
+    return migrated
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        migrated = await migrate_partitions(dry_run=args.dry_run, keep_legacy=args.keep_legacy)
+        logger.info(f"Migration finished: {migrated} entities moved")
+    finally:
+        await write_pipeline.close()
+        await close_storage()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move race events to series/season partitions")
+    parser.add_argument("--dry-run", action="store_true", help="report the new layout without writing")
+    parser.add_argument("--keep-legacy", action="store_true", help="do not delete the legacy partition")
+    asyncio.run(main(parser.parse_args()))
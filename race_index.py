@@ -0,0 +1,146 @@
+"""
+RaceCentral 2.0 - Time-Sorted Race Index
+Race views ordered by start time, so time-window lookups are bisects plus slices.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Optional
+
+from race_views import build_race_view, group_by_month
+
+
+def parse_start_time(start_time: str) -> Optional[datetime]:
+    """Parse an ISO StartTime ("2025-03-02T15:00:00Z") into an aware datetime."""
+    try:
+        return datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+    except Exception:
+        return None
+
+
+class RaceIndex:
+    """
+    Race views held in a list sorted by epoch timestamp, plus one sub-index
+    (and month grouping) per series.
+
+    Built once per data version. Every window query ("next 7 days", "last N
+    completed", "month X", "season Y") bisects the timestamp array and slices
+    the parallel list of views (see race_views), instead of reparsing,
+    formatting and scanning every race. Races whose StartTime can't be
+    parsed are left out, as the routes did.
+    """
+
+    def __init__(self, events: list[dict]):
+        entries = []
+        for event in events:
+            start = parse_start_time(event.get("StartTime", ""))
+            if start is not None:
+                entries.append((start.timestamp(), build_race_view(event, start)))
+        entries.sort(key=lambda entry: entry[0])
+
+        self.timestamps: list[float] = [ts for ts, _ in entries]
+        self.races: list[dict] = [view for _, view in entries]
+
+        self._series: dict[str, tuple[list[float], list[dict]]] = {}
+        for ts, view in entries:
+            key = view.get("Series", "").lower()
+            timestamps, races = self._series.setdefault(key, ([], []))
+            timestamps.append(ts)
+            races.append(view)
+
+        self._positions: dict[str, dict[str, int]] = {}
+        self._months: dict[str, list[dict]] = {"all": group_by_month(self.races)}
+        for key, (_, races) in self._series.items():
+            self._months[key] = group_by_month(races)
+
+    def __len__(self) -> int:
+        return len(self.races)
+
+    def _arrays(self, series: Optional[str]) -> tuple[list[float], list[dict]]:
+        if not series or series.lower() == "all":
+            return self.timestamps, self.races
+        return self._series.get(series.lower(), ([], []))
+
+    def _position(self, series: Optional[str], row_key: str) -> int:
+        """Position of the race with `row_key` in the series' array (built on first use)."""
+        key = (series or "all").lower()
+        if key != "all" and key not in self._series:
+            return 0
+
+        positions = self._positions.get(key)
+        if positions is None:
+            races = self._arrays(series)[1]
+            positions = self._positions[key] = {race.get("RowKey", ""): i for i, race in enumerate(races)}
+
+        position = positions.get(row_key)
+        if position is None:
+            # Cursor race is gone (removed by a sync) - RowKeys start with the
+            # timestamp, so bisecting on them lands in the right place
+            position = bisect_left(self._arrays(series)[1], row_key, key=_row_key)
+        return position
+
+    def between(self, start: datetime, end: datetime, series: Optional[str] = None) -> list[dict]:
+        """Races with start < StartTime <= end, soonest first."""
+        timestamps, races = self._arrays(series)
+        lo = bisect_right(timestamps, start.timestamp())
+        hi = bisect_right(timestamps, end.timestamp())
+        return races[lo:hi]
+
+    def upcoming(self, now: datetime, until: datetime, series: Optional[str] = None) -> list[dict]:
+        """Races that haven't started yet and start no later than `until`."""
+        return self.between(now, until, series)
+
+    def past(
+        self,
+        now: datetime,
+        limit: Optional[int] = None,
+        series: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Races that started at or before `now`, most recent first.
+        `before` is a RowKey cursor: only races older than that one are returned.
+        """
+        timestamps, races = self._arrays(series)
+        hi = bisect_right(timestamps, now.timestamp())
+        if before:
+            hi = min(hi, self._position(series, before))
+        lo = max(0, hi - limit) if limit is not None else 0
+        return races[lo:hi][::-1]
+
+    def range(self, start: datetime, end: datetime, series: Optional[str] = None) -> list[dict]:
+        """Races with start <= StartTime < end, soonest first."""
+        timestamps, races = self._arrays(series)
+        lo = bisect_left(timestamps, start.timestamp())
+        hi = bisect_left(timestamps, end.timestamp())
+        return races[lo:hi]
+
+    def season(self, year: int, series: Optional[str] = None) -> list[dict]:
+        """Races in a calendar year (UTC)."""
+        return self.range(
+            datetime(year, 1, 1, tzinfo=timezone.utc),
+            datetime(year + 1, 1, 1, tzinfo=timezone.utc),
+            series,
+        )
+
+    def next_start(self, after: datetime) -> Optional[datetime]:
+        """Start time of the first race starting after `after`, if any."""
+        i = bisect_right(self.timestamps, after.timestamp())
+        if i == len(self.timestamps):
+            return None
+        return datetime.fromtimestamp(self.timestamps[i], tz=timezone.utc)
+
+    def all(self, series: Optional[str] = None) -> list[dict]:
+        """Every race, soonest first."""
+        return self._arrays(series)[1]
+
+    def months(self, year: Optional[int] = None, series: Optional[str] = None) -> list[dict]:
+        """Races grouped by calendar month (UTC), optionally limited to one year."""
+        months = self._months.get((series or "all").lower(), [])
+        if year is None:
+            return months
+        return [month for month in months if month["year"] == year]
+
+
+def _row_key(race: dict) -> str:
+    return race.get("RowKey", "")
@@ -0,0 +1,123 @@
+"""
+RaceCentral 2.0 - In-Memory Race Event Store
+Versioned read-through cache of race events, refreshed by the background sync.
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from race_index import RaceIndex
+
+logger = logging.getLogger(__name__)
+
+RaceLoader = Callable[[], Awaitable[list[dict]]]
+
+
+class RaceEventStore:
+    """
+    In-memory copy of every race event, tagged with a version number.
+
+    The first read loads from storage; after that all routes are served from
+    memory until a sync calls refresh(). The (version, events, loaded_at,
+    index) snapshot is replaced with a single assignment, so a reader always
+    sees one complete calendar - never a half-synced one.
+    """
+
+    def __init__(self):
+        self._snapshot: tuple[int, Optional[list[dict]], Optional[datetime], Optional[RaceIndex]] = (
+            0, None, None, None
+        )
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._snapshot[0]
+
+    @property
+    def loaded_at(self) -> Optional[datetime]:
+        return self._snapshot[2]
+
+    @property
+    def index(self) -> Optional[RaceIndex]:
+        return self._snapshot[3]
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot[1] is not None
+
+    def swap(self, events: list[dict]) -> int:
+        """
+        Atomically replace the cached events (and their time index) and bump the version.
+        Events are kept in RowKey order, which is start time order since RowKeys
+        begin with the timestamp, so the RowKey can serve as a paging cursor.
+        """
+        events = sorted(events, key=_row_key)
+        version = self._snapshot[0] + 1
+        self._snapshot = (version, events, datetime.now(timezone.utc), RaceIndex(events))
+        logger.info(f"Race store updated to version {version} ({len(events)} events)")
+        return version
+
+    async def get(self, loader: RaceLoader) -> list[dict]:
+        """
+        Return the cached events, loading them with `loader` on a miss.
+        Concurrent misses share a single load.
+        """
+        events = self._snapshot[1]
+        if events is not None:
+            return events
+
+        async with self._lock:
+            events = self._snapshot[1]
+            if events is None:
+                self.swap(await loader())
+                events = self._snapshot[1]
+        return events
+
+    async def get_index(self, loader: RaceLoader) -> RaceIndex:
+        """Return the time index for the cached events, loading them on a miss."""
+        await self.get(loader)
+        return self._snapshot[3]
+
+    async def refresh(self, loader: RaceLoader) -> int:
+        """Reload from storage and swap the result in (called after a sync)."""
+        async with self._lock:
+            return self.swap(await loader())
+
+    async def page(
+        self,
+        loader: RaceLoader,
+        lower: str = "",
+        upper: str = "~",
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        series: Optional[str] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        Events with lower <= RowKey < upper (see utils.row_key_range), after
+        `cursor` (the last RowKey of the previous page), up to `limit` of them.
+        Returns (events, next_cursor); next_cursor is None on the last page.
+        """
+        events = await self.get(loader)
+        lo = bisect_left(events, lower, key=_row_key)
+        if cursor:
+            lo = max(lo, bisect_right(events, cursor, key=_row_key))
+        hi = bisect_left(events, upper, key=_row_key)
+
+        # Series match ignores case, like the RaceIndex filters
+        series = series.lower() if series else None
+        selected = []
+        for i in range(lo, hi):
+            event = events[i]
+            if series and event.get("Series", "").lower() != series:
+                continue
+            if limit is not None and len(selected) == limit:
+                return selected, selected[-1].get("RowKey")
+            selected.append(event)
+        return selected, None
+
+
+def _row_key(event: dict) -> str:
+    return event.get("RowKey", "")
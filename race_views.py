@@ -0,0 +1,47 @@
+"""
+RaceCentral 2.0 - Race View Models
+Template-ready copies of race events, built once per data version so routes
+only slice precomputed lists instead of reparsing and formatting per request.
+"""
+
+from datetime import datetime
+
+from utils import format_start_time
+
+# Entity fields any HTML template renders (race cards, past races, calendar)
+VIEW_FIELDS = (
+    "RowKey", "Series", "RaceName", "Venue", "Country", "StartTime", "Network",
+    "Latitude", "Longitude", "Odds_Data", "Polymarket_Prob",
+    "Winner", "Podium2", "Podium3",
+)
+
+
+def build_race_view(event: dict, start: datetime) -> dict:
+    """
+    New dict with the rendered fields of `event` plus its display strings.
+    The stored entity is never modified; views are shared between requests
+    and must be treated as read-only.
+    """
+    view = {field: event[field] for field in VIEW_FIELDS if field in event}
+    view["start"] = start
+    view["time_info"] = format_start_time(start)
+    view["month_key"] = start.strftime("%Y-%m")
+    view["month_name"] = start.strftime("%B %Y")
+    view["day"] = start.strftime("%d")
+    view["weekday"] = start.strftime("%a")
+    return view
+
+
+def group_by_month(views: list[dict]) -> list[dict]:
+    """Group time-ordered views into [{"key", "name", "year", "races"}, ...] in month order."""
+    months: list[dict] = []
+    for view in views:
+        if not months or months[-1]["key"] != view["month_key"]:
+            months.append({
+                "key": view["month_key"],
+                "name": view["month_name"],
+                "year": view["start"].year,
+                "races": [],
+            })
+        months[-1]["races"].append(view)
+    return months
@@ -0,0 +1,171 @@
+"""
+RaceCentral 2.0 - Rendered Response Cache
+Short-lived cache of rendered response bodies with strong ETags, plus their
+gzip/brotli encodings, compressed once per entry.
+"""
+
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Hashable, Optional
+
+try:
+    import brotli
+except ImportError:  # optional - responses fall back to gzip
+    brotli = None
+
+# Bodies smaller than this aren't worth compressing
+COMPRESS_MIN_SIZE = 500
+
+# Brotli 11 takes hundreds of ms on a full calendar page; 5 compresses
+# nearly as well (still smaller than gzip -9) in a few ms
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 9
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with a supported content-coding ("br" or "gzip")."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class BrotliWriter:
+    """
+    Write-only file object that brotli-compresses into `fileobj` - stands in
+    for gzip.GzipFile where responses are compressed as they stream.
+    """
+
+    def __init__(self, fileobj, quality: int = BROTLI_QUALITY):
+        self._fileobj = fileobj
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def write(self, data: bytes) -> None:
+        self._fileobj.write(self._compressor.process(data))
+
+    def close(self) -> None:
+        self._fileobj.write(self._compressor.finish())
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> set[str]:
+    """Content-codings listed in an Accept-Encoding header, minus any refused with q=0."""
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best content-coding the client accepts: br if available, then gzip, else None."""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+@dataclass
+class CachedResponse:
+    """A rendered response body and the validators sent with it."""
+    body: bytes
+    media_type: str
+    etag: str
+    created_at: float = field(default_factory=time.time)
+    headers: dict = field(default_factory=dict)
+    encoded: dict = field(default_factory=dict)
+
+    def encoded_body(self, encoding: str) -> bytes:
+        """The body in `encoding`, compressed on first use and reused after that."""
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = self.encoded[encoding] = compress(self.body, encoding)
+        return body
+
+    def encoded_etag(self, encoding: Optional[str]) -> str:
+        """ETag of one encoding of the body - each representation gets its own strong ETag."""
+        return f'{self.etag[:-1]}-{encoding}"' if encoding else self.etag
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the response bytes."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def http_date(dt: datetime) -> str:
+    """Format an aware datetime as an HTTP date (Last-Modified)."""
+    return format_datetime(dt.replace(microsecond=0), usegmt=True)
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[str]) -> bool:
+    """Check an If-Modified-Since header against a Last-Modified value."""
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+class ResponseCache:
+    """
+    LRU cache of rendered responses with a time-to-live.
+
+    Keys should include the data version, so a sync makes old entries
+    unreachable at once; the TTL bounds how stale anything left out of the
+    key can get, and max_entries bounds memory when clients send arbitrary
+    query strings. Compressed encodings live on the entry and expire with it.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry.created_at > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, body: bytes, media_type: str, headers: Optional[dict] = None) -> CachedResponse:
+        entry = CachedResponse(body=body, media_type=media_type, etag=make_etag(body), headers=headers or {})
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
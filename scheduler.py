@@ -0,0 +1,211 @@
+"""
+RaceCentral 2.0 - Background Job Scheduler
+Independently timed sync, odds, standings and results jobs on APScheduler,
+replacing the single fixed-interval worker loop.
+"""
+
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+# Odds refresh interval by time until the next race: (closer than, refresh every)
+ODDS_INTERVALS = [
+    (timedelta(days=1), timedelta(minutes=30)),
+    (timedelta(days=2), timedelta(hours=2)),
+    (timedelta(days=7), timedelta(hours=6)),
+]
+ODDS_IDLE_INTERVAL = timedelta(hours=24)
+
+# Results are first polled this long after the start, then retried until found
+RESULTS_DELAY = timedelta(hours=2)
+RESULTS_RETRY_INTERVAL = timedelta(minutes=30)
+RESULTS_MAX_ATTEMPTS = 12
+
+# Random spread added to every run, so restarts and replicas don't hit the APIs in lockstep
+JITTER_SECONDS = 120
+
+
+def odds_refresh_interval(next_race: Optional[datetime], now: datetime) -> timedelta:
+    """How long until the next odds refresh - shorter as the next race gets closer."""
+    if next_race is None:
+        return ODDS_IDLE_INTERVAL
+    until_race = next_race - now
+    for closer_than, interval in ODDS_INTERVALS:
+        if until_race < closer_than:
+            return interval
+    return ODDS_IDLE_INTERVAL
+
+
+def jittered(run_at: datetime) -> datetime:
+    return run_at + timedelta(seconds=random.uniform(0, JITTER_SECONDS))
+
+
+class RaceJobScheduler:
+    """
+    Runs the background jobs on an AsyncIOScheduler in the app's event loop.
+
+    - sync: full schedule sync, every `sync_interval_hours` (first run at start)
+    - standings: daily, and again right after new F1 results land
+    - odds: re-planned after each run from the time to the next race
+    - results: one poll per race at StartTime + 2h, retried until results exist
+
+    Every job has max_instances=1 and coalesce=True, so a slow run is never
+    overlapped by the next one and missed runs collapse into one. Running
+    jobs are tracked so stop() can cancel them: a demoted leader must not
+    keep writing while the new one syncs.
+    """
+
+    def __init__(
+        self,
+        sync: Job,
+        odds: Job,
+        standings: Job,
+        results: Callable[[str], Awaitable[bool]],
+        pending_results: Callable[[], Awaitable[list[tuple[str, datetime]]]],
+        next_race_start: Callable[[], Awaitable[Optional[datetime]]],
+        sync_interval_hours: float = 24,
+    ):
+        self._sync = sync
+        self._odds = odds
+        self._standings = standings
+        self._results = results
+        self._pending_results = pending_results
+        self._next_race_start = next_race_start
+        self.sync_interval_hours = sync_interval_hours
+        self._scheduler: Optional[AsyncIOScheduler] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._scheduler is not None and self._scheduler.running
+
+    def start(self) -> None:
+        """Create the scheduler in the running event loop and queue the first runs."""
+        now = datetime.now(timezone.utc)
+        self._scheduler = AsyncIOScheduler(
+            timezone=timezone.utc,
+            job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 600},
+        )
+        self._add_job(
+            self._run_sync, IntervalTrigger(hours=self.sync_interval_hours, jitter=JITTER_SECONDS),
+            id="sync", next_run_time=now,
+        )
+        self._add_job(
+            self._run_standings, IntervalTrigger(hours=24, jitter=JITTER_SECONDS),
+            id="standings", next_run_time=jittered(now + timedelta(minutes=5)),
+        )
+        self._add_job(self._run_odds, "date", id="odds", run_date=jittered(now + timedelta(minutes=5)))
+        self._scheduler.start()
+        logger.info("Background job scheduler started")
+
+    def stop(self) -> None:
+        """
+        Shut the scheduler down and cancel the jobs in progress (on losing
+        leadership or at exit). A cancelled sync is simply run again in full
+        by the next leader; await wait_stopped() before closing storage.
+        """
+        if self.running:
+            self._scheduler.shutdown(wait=False)
+            logger.info("Background job scheduler stopped")
+        self._scheduler = None
+        for task in self._tasks:
+            task.cancel()
+
+    async def wait_stopped(self) -> None:
+        """Wait for the jobs cancelled by stop() to unwind."""
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _add_job(self, job: Callable[..., Awaitable[None]], trigger, args: tuple = (), **kwargs) -> None:
+        self._scheduler.add_job(self._run_tracked, trigger, args=[job, *args], **kwargs)
+
+    async def _run_tracked(self, job: Callable[..., Awaitable[None]], *args) -> None:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            await job(*args)
+        finally:
+            self._tasks.discard(task)
+
+    async def _run_sync(self) -> None:
+        try:
+            await self._sync()
+        except Exception as e:
+            logger.error(f"Data sync error: {e}")
+        await self._plan_results()
+
+    async def _run_standings(self) -> None:
+        try:
+            await self._standings()
+        except Exception as e:
+            logger.error(f"F1 standings sync error: {e}")
+
+    async def _run_odds(self) -> None:
+        try:
+            await self._odds()
+        except Exception as e:
+            logger.error(f"Odds update error: {e}")
+
+        now = datetime.now(timezone.utc)
+        try:
+            next_race = await self._next_race_start()
+        except Exception as e:
+            logger.error(f"Failed to find next race for odds scheduling: {e}")
+            next_race = None
+        # Stopped while running - the next leader schedules its own odds updates
+        if not self.running:
+            return
+        interval = odds_refresh_interval(next_race, now)
+        run_at = jittered(now + interval)
+        self._add_job(self._run_odds, "date", id="odds", run_date=run_at, replace_existing=True)
+        logger.info(f"Next odds update at {run_at:%Y-%m-%d %H:%M} UTC (every {interval})")
+
+    async def _plan_results(self) -> None:
+        """Schedule a results poll for every race still waiting on results."""
+        try:
+            pending = await self._pending_results()
+        except Exception as e:
+            logger.error(f"Failed to plan results polls: {e}")
+            return
+
+        if not self.running:
+            return
+        now = datetime.now(timezone.utc)
+        for row_key, start in pending:
+            run_at = max(start + RESULTS_DELAY, now)
+            self._add_job(
+                self._run_results, "date", args=(row_key, 1),
+                id=f"results-{row_key}", run_date=jittered(run_at), replace_existing=True,
+            )
+        if pending:
+            logger.info(f"Planned results polls for {len(pending)} races")
+
+    async def _run_results(self, row_key: str, attempt: int) -> None:
+        try:
+            found = await self._results(row_key)
+        except Exception as e:
+            logger.error(f"Results poll error for {row_key}: {e}")
+            found = False
+
+        # Stopped while polling - the next leader plans its own polls
+        if not self.running:
+            return
+        if found:
+            # New results move the championship - refresh standings now
+            self._scheduler.modify_job("standings", next_run_time=datetime.now(timezone.utc))
+        elif attempt < RESULTS_MAX_ATTEMPTS:
+            self._add_job(
+                self._run_results, "date", args=(row_key, attempt + 1),
+                id=f"results-{row_key}", run_date=jittered(datetime.now(timezone.utc) + RESULTS_RETRY_INTERVAL),
+                replace_existing=True,
+            )
+        else:
+            logger.warning(f"No results for {row_key} after {attempt} polls - leaving it to the daily sync")
@@ -0,0 +1,84 @@
+"""
+RaceCentral 2.0 - On-Disk Data Snapshot
+Last-known-good copy of race events, standings and news, written after each
+successful sync and loaded at startup so the first request is served warm.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+
+def write_snapshot(path: str, events: list[dict], standings: dict, news: list[dict]) -> None:
+    """Write a gzipped JSON snapshot atomically (temp file + rename)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    data = {
+        "format": SNAPSHOT_FORMAT,
+        "saved_at": datetime.now(timezone.utc).isoformat(),
+        "events": events,
+        "standings": standings,
+        "news": news,
+    }
+    payload = json.dumps(data, separators=(",", ":"), default=str).encode()
+
+    # A temp file of its own per write - overlapping saves (sync, standings)
+    # must not interleave in one file before the rename
+    with tempfile.NamedTemporaryFile(
+        dir=directory or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = tmp.name
+        try:
+            with gzip.GzipFile(fileobj=tmp, mode="wb", compresslevel=6) as f:
+                f.write(payload)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str) -> Optional[dict]:
+    """Read a snapshot, or return None if it's missing, unreadable or an old format."""
+    try:
+        with gzip.open(path, "rb") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Failed to read snapshot {path}: {e}")
+        return None
+
+    if data.get("format") != SNAPSHOT_FORMAT:
+        logger.warning(f"Ignoring snapshot {path} with format {data.get('format')}")
+        return None
+    return data
+
+
+async def save_snapshot(path: str, events: list[dict], standings: dict, news: list[dict]) -> bool:
+    """Write a snapshot without blocking the event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, write_snapshot, path, events, standings, news)
+        logger.info(f"Saved snapshot with {len(events)} events to {path}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save snapshot {path}: {e}")
+        return False
+
+
+async def load_snapshot(path: str) -> Optional[dict]:
+    """Read a snapshot without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, read_snapshot, path)
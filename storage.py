@@ -0,0 +1,382 @@
+"""
+RaceCentral 2.0 - Storage Backends
+Entity storage used by the sync worker and routes, with an Azure Table Storage
+backend for production and an embedded SQLite backend for local runs,
+benchmarks and single-node deployments.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
+from azure.data.tables import UpdateMode
+from azure.data.tables.aio import TableServiceClient as AsyncTableServiceClient
+
+logger = logging.getLogger(__name__)
+
+# Transaction operations use the Azure SDK tuple format:
+#   ("upsert", entity, {"mode": UpdateMode.MERGE}) or ("delete", {"PartitionKey": ..., "RowKey": ...})
+TransactionOperation = tuple
+
+
+class StorageBackend(ABC):
+    """
+    Table-style entity store keyed by (PartitionKey, RowKey).
+
+    Every read is a key lookup: a single entity, or one partition optionally
+    narrowed to an inclusive RowKey range.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def open(self) -> None:
+        """Connect and create the table if needed."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections."""
+
+    @abstractmethod
+    async def query_entities(
+        self,
+        partition_key: str,
+        row_key_range: Optional[tuple[str, str]] = None,
+        select: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """Return entities in a partition, optionally within a RowKey range."""
+
+    @abstractmethod
+    async def get_entity(self, partition_key: str, row_key: str) -> Optional[dict]:
+        """Return a single entity, or None if it doesn't exist."""
+
+    @abstractmethod
+    async def upsert_entity(self, entity: dict, merge: bool = True) -> None:
+        """Insert or update an entity (MERGE keeps properties not in `entity`)."""
+
+    @abstractmethod
+    async def submit_transaction(self, operations: list[TransactionOperation]) -> None:
+        """Apply operations on one partition atomically."""
+
+    @abstractmethod
+    async def acquire_lease(self, partition_key: str, row_key: str, owner: str, duration_seconds: float) -> bool:
+        """
+        Take or renew a lease entity. Succeeds if the lease is free, expired
+        or already held by `owner`; the check-and-write is atomic, so two
+        processes can never both win.
+        """
+
+    @abstractmethod
+    async def release_lease(self, partition_key: str, row_key: str, owner: str) -> None:
+        """Give up a lease held by `owner` (no-op if someone else holds it)."""
+
+
+def lease_available(lease: Optional[dict], owner: str, now: float) -> bool:
+    """Whether `owner` may take a lease entity: it's missing, ours, or expired."""
+    return lease is None or lease.get("Owner") == owner or float(lease.get("ExpiresAt", 0)) < now
+
+
+# =============================================================================
+# AZURE TABLE STORAGE
+# =============================================================================
+
+class AzureTableStorage(StorageBackend):
+    """Azure Table Storage backend using one long-lived async client."""
+
+    name = "azure"
+
+    def __init__(self, connection_string: str, table_name: str):
+        self.connection_string = connection_string
+        self.table_name = table_name
+        self._service: Optional[AsyncTableServiceClient] = None
+        self._client = None
+
+    async def open(self) -> None:
+        service = AsyncTableServiceClient.from_connection_string(self.connection_string)
+        try:
+            await service.create_table_if_not_exists(self.table_name)
+        except Exception as e:
+            logger.error(f"Failed to create table {self.table_name}: {e}")
+
+        self._service = service
+        self._client = service.get_table_client(self.table_name)
+        logger.info(f"Connected to Azure Table Storage: {self.table_name}")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        if self._service is not None:
+            await self._service.close()
+        self._service = None
+        self._client = None
+
+    async def query_entities(
+        self,
+        partition_key: str,
+        row_key_range: Optional[tuple[str, str]] = None,
+        select: Optional[list[str]] = None,
+    ) -> list[dict]:
+        query_filter = f"PartitionKey eq '{partition_key}'"
+        if row_key_range:
+            query_filter += f" and RowKey ge '{row_key_range[0]}' and RowKey le '{row_key_range[1]}'"
+
+        return [
+            dict(entity)
+            async for entity in self._client.query_entities(query_filter, select=select)
+        ]
+
+    async def get_entity(self, partition_key: str, row_key: str) -> Optional[dict]:
+        try:
+            return dict(await self._client.get_entity(partition_key, row_key))
+        except ResourceNotFoundError:
+            return None
+
+    async def upsert_entity(self, entity: dict, merge: bool = True) -> None:
+        mode = UpdateMode.MERGE if merge else UpdateMode.REPLACE
+        await self._client.upsert_entity(entity, mode=mode)
+
+    async def submit_transaction(self, operations: list[TransactionOperation]) -> None:
+        await self._client.submit_transaction(operations)
+
+    async def acquire_lease(self, partition_key: str, row_key: str, owner: str, duration_seconds: float) -> bool:
+        now = time.time()
+        lease = {"PartitionKey": partition_key, "RowKey": row_key, "Owner": owner, "ExpiresAt": now + duration_seconds}
+        try:
+            current = await self._client.get_entity(partition_key, row_key)
+        except ResourceNotFoundError:
+            try:
+                await self._client.create_entity(lease)
+                return True
+            except ResourceExistsError:
+                return False
+
+        if not lease_available(dict(current), owner, now):
+            return False
+        # Conditional on the ETag we read - fails if another process renewed or took it since
+        try:
+            await self._client.update_entity(
+                lease, mode=UpdateMode.REPLACE,
+                etag=current.metadata["etag"], match_condition=MatchConditions.IfNotModified,
+            )
+            return True
+        except HttpResponseError as e:
+            if e.status_code == 412:
+                return False
+            raise
+
+    async def release_lease(self, partition_key: str, row_key: str, owner: str) -> None:
+        try:
+            current = await self._client.get_entity(partition_key, row_key)
+            if current.get("Owner") == owner:
+                await self._client.delete_entity(
+                    partition_key, row_key,
+                    etag=current.metadata["etag"], match_condition=MatchConditions.IfNotModified,
+                )
+        except (ResourceNotFoundError, HttpResponseError):
+            pass
+
+
+# =============================================================================
+# EMBEDDED SQLITE
+# =============================================================================
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    PartitionKey TEXT NOT NULL,
+    RowKey TEXT NOT NULL,
+    Series TEXT,
+    Season INTEGER,
+    StartTime TEXT,
+    Data TEXT NOT NULL,
+    PRIMARY KEY (PartitionKey, RowKey)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_entities_series ON entities (Series, StartTime);
+CREATE INDEX IF NOT EXISTS idx_entities_start ON entities (StartTime);
+CREATE INDEX IF NOT EXISTS idx_entities_season ON entities (Season, Series);
+"""
+
+
+def _season_of(entity: dict) -> Optional[int]:
+    """Season of an entity: its Season property, else the year of StartTime."""
+    if entity.get("Season"):
+        return int(entity["Season"])
+    try:
+        return datetime.fromisoformat(entity["StartTime"].replace('Z', '+00:00')).year
+    except Exception:
+        return None
+
+
+class SQLiteStorage(StorageBackend):
+    """
+    Single-file SQLite backend.
+
+    Entities are stored as JSON with Series, Season and StartTime copied into
+    indexed columns. All database work runs on one dedicated thread so the
+    event loop never blocks on disk I/O.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _open_sync(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SQLITE_SCHEMA)
+        self._conn = conn
+
+    async def open(self) -> None:
+        await self._run(self._open_sync)
+        logger.info(f"Opened SQLite storage: {self.path}")
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._run(self._conn.close)
+        self._conn = None
+
+    def _query_sync(self, partition_key, row_key_range, select) -> list[dict]:
+        sql = "SELECT Data FROM entities WHERE PartitionKey = ?"
+        params: list = [partition_key]
+        if row_key_range:
+            sql += " AND RowKey >= ? AND RowKey <= ?"
+            params += list(row_key_range)
+        sql += " ORDER BY RowKey"
+
+        entities = []
+        for (data,) in self._conn.execute(sql, params):
+            entity = json.loads(data)
+            if select:
+                entity = {field: entity[field] for field in select if field in entity}
+            entities.append(entity)
+        return entities
+
+    async def query_entities(
+        self,
+        partition_key: str,
+        row_key_range: Optional[tuple[str, str]] = None,
+        select: Optional[list[str]] = None,
+    ) -> list[dict]:
+        return await self._run(self._query_sync, partition_key, row_key_range, select)
+
+    def _get_sync(self, partition_key: str, row_key: str) -> Optional[dict]:
+        row = self._conn.execute(
+            "SELECT Data FROM entities WHERE PartitionKey = ? AND RowKey = ?",
+            (partition_key, row_key),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def get_entity(self, partition_key: str, row_key: str) -> Optional[dict]:
+        return await self._run(self._get_sync, partition_key, row_key)
+
+    def _upsert_sync(self, entity: dict, merge: bool) -> None:
+        if merge:
+            current = self._get_sync(entity["PartitionKey"], entity["RowKey"])
+            if current:
+                entity = {**current, **entity}
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entities (PartitionKey, RowKey, Series, Season, StartTime, Data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                entity["PartitionKey"],
+                entity["RowKey"],
+                entity.get("Series"),
+                _season_of(entity),
+                entity.get("StartTime"),
+                json.dumps(entity, default=str),
+            ),
+        )
+
+    def _apply_sync(self, operations: list[TransactionOperation]) -> None:
+        self._conn.execute("BEGIN")
+        try:
+            for operation in operations:
+                action, entity = operation[0], operation[1]
+                options = operation[2] if len(operation) > 2 else {}
+                if action == "delete":
+                    self._conn.execute(
+                        "DELETE FROM entities WHERE PartitionKey = ? AND RowKey = ?",
+                        (entity["PartitionKey"], entity["RowKey"]),
+                    )
+                elif action == "upsert":
+                    merge = options.get("mode", UpdateMode.MERGE) == UpdateMode.MERGE
+                    self._upsert_sync(entity, merge)
+                else:
+                    raise ValueError(f"Unsupported transaction operation: {action}")
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    async def upsert_entity(self, entity: dict, merge: bool = True) -> None:
+        mode = UpdateMode.MERGE if merge else UpdateMode.REPLACE
+        await self._run(self._apply_sync, [("upsert", entity, {"mode": mode})])
+
+    async def submit_transaction(self, operations: list[TransactionOperation]) -> None:
+        await self._run(self._apply_sync, list(operations))
+
+    def _lease_sync(self, partition_key: str, row_key: str, owner: str, duration_seconds: Optional[float]) -> bool:
+        # BEGIN IMMEDIATE takes the database write lock up front, so the
+        # check-and-write is atomic across processes sharing the file
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            current = self._get_sync(partition_key, row_key)
+            if duration_seconds is None:
+                # Release
+                if current and current.get("Owner") == owner:
+                    self._conn.execute(
+                        "DELETE FROM entities WHERE PartitionKey = ? AND RowKey = ?", (partition_key, row_key)
+                    )
+                acquired = False
+            elif lease_available(current, owner, now):
+                self._upsert_sync({
+                    "PartitionKey": partition_key,
+                    "RowKey": row_key,
+                    "Owner": owner,
+                    "ExpiresAt": now + duration_seconds,
+                }, merge=False)
+                acquired = True
+            else:
+                acquired = False
+            self._conn.execute("COMMIT")
+            return acquired
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    async def acquire_lease(self, partition_key: str, row_key: str, owner: str, duration_seconds: float) -> bool:
+        return await self._run(self._lease_sync, partition_key, row_key, owner, duration_seconds)
+
+    async def release_lease(self, partition_key: str, row_key: str, owner: str) -> None:
+        await self._run(self._lease_sync, partition_key, row_key, owner, None)
+
+
+def create_storage_backend(backend: str, connection_string: str, table_name: str, sqlite_path: str) -> Optional[StorageBackend]:
+    """Build the configured storage backend (None if Azure is selected but not configured)."""
+    if backend == "sqlite":
+        return SQLiteStorage(sqlite_path)
+
+    if not connection_string:
+        logger.warning("AZURE_STORAGE_CONNECTION_STRING not configured")
+        return None
+    return AzureTableStorage(connection_string, table_name)
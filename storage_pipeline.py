@@ -0,0 +1,109 @@
+"""
+RaceCentral 2.0 - Storage Write Pipeline
+Bounded-concurrency queue for storage writes, with per-operation timing.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+WriteOperation = Callable[[], Awaitable[Any]]
+
+
+class StorageWritePipeline:
+    """
+    Runs storage writes through a fixed pool of workers fed by a bounded queue.
+
+    At most `concurrency` writes are in flight at once, so independent writes
+    overlap instead of waiting on each other's round trip. When `queue_size`
+    writes are already waiting, submit() blocks the producer (backpressure)
+    rather than piling up unbounded work.
+    """
+
+    def __init__(self, concurrency: int = 8, queue_size: int = 100):
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.stats: dict[str, dict] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_workers(self) -> None:
+        """Start workers on the running loop (restarting them if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            loop.create_task(self._worker(), name=f"storage-writer-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def submit(self, operation: WriteOperation, label: str = "write") -> Any:
+        """Queue a write, wait for it to run and return its result (or raise its error)."""
+        self._ensure_workers()
+        future = self._loop.create_future()
+        await self._queue.put((operation, label, future))
+        return await future
+
+    async def _worker(self) -> None:
+        while True:
+            operation, label, future = await self._queue.get()
+            start = time.perf_counter()
+            failed = False
+            try:
+                if not future.cancelled():
+                    result = await operation()
+                    if not future.done():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                failed = True
+                if not future.done():
+                    future.cancel()
+                # Only close() stops a worker - a write that raised CancelledError
+                # itself must not shrink the pool for the rest of the process
+                if asyncio.current_task().cancelling():
+                    raise
+            except Exception as e:
+                failed = True
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._record(label, time.perf_counter() - start, failed)
+                self._queue.task_done()
+
+    def _record(self, label: str, elapsed: float, failed: bool) -> None:
+        stat = self.stats.setdefault(label, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        elapsed_ms = elapsed * 1000
+        stat["count"] += 1
+        stat["errors"] += int(failed)
+        stat["total_ms"] += elapsed_ms
+        stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+        logger.debug(f"{label} took {elapsed_ms:.1f} ms{' (failed)' if failed else ''}")
+
+    def log_stats(self, reset: bool = True) -> None:
+        """Log a timing summary per operation label."""
+        for label, stat in self.stats.items():
+            avg_ms = stat["total_ms"] / stat["count"] if stat["count"] else 0.0
+            logger.info(
+                f"Storage {label}: {stat['count']} ops, {stat['errors']} errors, "
+                f"avg {avg_ms:.1f} ms, max {stat['max_ms']:.1f} ms"
+            )
+        if reset:
+            self.stats = {}
+
+    async def close(self) -> None:
+        """Wait for queued writes to finish, then stop the workers."""
+        if self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
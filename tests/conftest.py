@@ -0,0 +1,38 @@
+"""
+Shared fixtures: every test gets a fresh SQLite database and an empty race
+store, with the app's on-disk paths pointed at a temporary directory.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Configure before main is imported - it reads these at import time
+_data_dir = tempfile.mkdtemp(prefix="racecentral-tests-")
+os.environ["AZURE_STORAGE_CONNECTION_STRING"] = ""
+os.environ["STORAGE_BACKEND"] = "sqlite"
+os.environ["SQLITE_DB_PATH"] = os.path.join(_data_dir, "racecentral.db")
+os.environ["SNAPSHOT_PATH"] = os.path.join(_data_dir, "snapshot.json.gz")
+os.environ["TEMPLATE_CACHE_DIR"] = os.path.join(_data_dir, "jinja_cache")
+os.environ["LEADER_LOCK_PATH"] = os.path.join(_data_dir, "leader.lock")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from race_store import RaceEventStore  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """The main module with its own database, snapshot and race store."""
+    monkeypatch.setattr(main, "SQLITE_DB_PATH", str(tmp_path / "racecentral.db"))
+    monkeypatch.setattr(main, "SNAPSHOT_PATH", str(tmp_path / "snapshot.json.gz"))
+    monkeypatch.setattr(main, "race_store", RaceEventStore())
+    monkeypatch.setattr(main, "_storage", None)
+    main.last_snapshot["data"] = None
+    main.render_cache.clear()
+    yield main
+    asyncio.run(main.close_storage())
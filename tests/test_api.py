@@ -0,0 +1,136 @@
+import asyncio
+from datetime import datetime, timezone
+
+from race_store import RaceEventStore
+from utils import row_key_range
+
+
+def test_parse_api_time_converts_offsets_to_utc(app):
+    dt = app.parse_api_time("2026-03-01T10:00:00+05:00")
+    assert dt == datetime(2026, 3, 1, 5, 0, tzinfo=timezone.utc)
+    assert dt.utcoffset().total_seconds() == 0
+    lower, _ = row_key_range(dt, None)
+    assert lower.startswith("202603010500")
+
+
+def test_parse_api_time_naive_and_date_values_are_utc(app):
+    assert app.parse_api_time("2026-03-01T10:00:00") == datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+    assert app.parse_api_time("2026-03-01", end_of_day=True) == datetime(2026, 3, 1, 23, 59, tzinfo=timezone.utc)
+
+
+def test_store_page_series_filter_ignores_case():
+    store = RaceEventStore()
+    store.swap([
+        {"RowKey": "202603011300_F1_A", "Series": "F1", "StartTime": "2026-03-01T13:00:00Z"},
+        {"RowKey": "202603081300_NASCAR_B", "Series": "NASCAR", "StartTime": "2026-03-08T13:00:00Z"},
+    ])
+
+    async def loader():
+        return []
+
+    events, cursor = asyncio.run(store.page(loader, series="nascar"))
+    assert [event["RowKey"] for event in events] == ["202603081300_NASCAR_B"]
+    assert cursor is None
+
+
+def test_calendar_page_rendered_during_outage_is_not_cached(app, monkeypatch):
+    """An empty /calendar from a failed load is replaced once storage recovers."""
+    from fastapi.testclient import TestClient
+
+    race = {"RowKey": "202603011300_F1_A", "PartitionKey": "F1_2026", "Series": "F1",
+            "RaceName": "Australian Grand Prix", "StartTime": "2026-03-01T13:00:00Z"}
+    events = {"rows": None}
+
+    async def load():
+        if events["rows"] is None:
+            raise RuntimeError("storage down")
+        return events["rows"]
+
+    monkeypatch.setattr(app, "load_race_events", load)
+    client = TestClient(app.app)
+
+    down = client.get("/calendar")
+    assert down.status_code == 200
+    assert "Australian Grand Prix" not in down.text
+
+    events["rows"] = [race]
+    assert "Australian Grand Prix" in client.get("/calendar").text
+
+
+def test_calendar_feed_built_during_outage_is_not_cached(app, monkeypatch):
+    """An empty /calendar.ics from a failed load is rebuilt once storage recovers."""
+    from fastapi.testclient import TestClient
+
+    race = {"RowKey": "202603011300_F1_A", "PartitionKey": "F1_2026", "Series": "F1",
+            "RaceName": "Australian Grand Prix", "StartTime": "2026-03-01T13:00:00Z"}
+    events = {"rows": None}
+
+    async def load():
+        if events["rows"] is None:
+            raise RuntimeError("storage down")
+        return events["rows"]
+
+    monkeypatch.setattr(app, "load_race_events", load)
+    client = TestClient(app.app)
+
+    down = client.get("/calendar.ics")
+    assert down.status_code == 200
+    assert down.headers["cache-control"] == "no-store"
+    assert "BEGIN:VEVENT" not in down.text
+
+    events["rows"] = [race]
+    assert client.get("/calendar.ics").text.count("BEGIN:VEVENT") == 1
+
+
+def test_race_pages_rendered_during_outage_are_not_cached(app, monkeypatch):
+    """No page that reads the race index caches a render from a failed load."""
+    from fastapi.testclient import TestClient
+
+    async def load():
+        raise RuntimeError("storage down")
+
+    async def no_news():
+        return []
+
+    async def no_standings(*args):
+        return {}
+
+    monkeypatch.setattr(app, "load_race_events", load)
+    monkeypatch.setattr(app, "fetch_news", no_news)
+    monkeypatch.setattr(app, "get_f1_standings_from_storage", no_standings)
+    monkeypatch.setattr(app, "fetch_f1_standings", no_standings)
+    client = TestClient(app.app)
+
+    for path in ("/", "/filter/F1", "/past-races", "/recent-races"):
+        response = client.get(path)
+        assert response.status_code == 200, path
+        assert response.headers["cache-control"] == "no-store", path
+    assert not app.render_cache._entries
+
+
+def test_uncached_responses_use_the_preferred_encoding(app, monkeypatch):
+    """/api/races negotiates br/gzip like the cached pages, and q=0 turns compression off."""
+    from fastapi.testclient import TestClient
+
+    races = [
+        {"RowKey": f"2026030{n}1300_F1_R{n}", "PartitionKey": "F1_2026", "Series": "F1",
+         "RaceName": f"Grand Prix {n}", "StartTime": f"2026-03-0{n}T13:00:00Z"}
+        for n in range(1, 10)
+    ]
+
+    async def load():
+        return races
+
+    monkeypatch.setattr(app, "load_race_events", load)
+    client = TestClient(app.app)
+
+    br = client.get("/api/races", headers={"Accept-Encoding": "gzip, br"})
+    assert br.headers["content-encoding"] == "br"
+    assert len(br.json()["races"]) == 9
+
+    gz = client.get("/api/races?format=ndjson", headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert len(gz.text.splitlines()) == 9
+
+    plain = client.get("/api/races", headers={"Accept-Encoding": "gzip;q=0, br;q=0"})
+    assert "content-encoding" not in plain.headers
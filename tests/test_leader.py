@@ -0,0 +1,121 @@
+import asyncio
+
+from leader import LeaderElection, LeaderLock
+
+
+class FlakyLease(LeaderLock):
+    """Lease lock whose renewals can be made to fail."""
+
+    def __init__(self, lease_seconds: float):
+        self.lease_seconds = lease_seconds
+        self.failing = False
+
+    async def acquire(self) -> bool:
+        if self.failing:
+            raise ConnectionError("storage unavailable")
+        return True
+
+    async def release(self) -> None:
+        pass
+
+
+def election(lock: LeaderLock, events: list[str], interval_seconds: float) -> LeaderElection:
+    return LeaderElection(
+        lock,
+        on_elected=lambda: events.append("elected"),
+        on_demoted=lambda: events.append("demoted"),
+        interval_seconds=interval_seconds,
+    )
+
+
+def test_renewal_error_keeps_a_valid_lease():
+    events = []
+    lock = FlakyLease(lease_seconds=60)
+    leader = election(lock, events, interval_seconds=20)
+
+    async def run():
+        assert await leader.check()
+        lock.failing = True
+        return await leader.check()
+
+    assert asyncio.run(run())
+    assert events == ["elected"]
+
+
+def test_renewal_error_demotes_once_the_lease_could_lapse():
+    events = []
+    lock = FlakyLease(lease_seconds=10)
+    leader = election(lock, events, interval_seconds=20)
+
+    async def run():
+        assert await leader.check()
+        lock.failing = True
+        return await leader.check()
+
+    assert not asyncio.run(run())
+    assert events == ["elected", "demoted"]
+
+
+def test_demotion_cancels_running_jobs():
+    """A demoted leader stops its in-flight sync instead of racing the new leader's."""
+    from scheduler import RaceJobScheduler
+
+    started = asyncio.Event()
+    events = []
+
+    async def sync():
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    async def nothing(*args):
+        return None
+
+    scheduler = RaceJobScheduler(
+        sync=sync, odds=nothing, standings=nothing, results=nothing,
+        pending_results=lambda: nothing(), next_race_start=lambda: nothing(),
+    )
+    leader = LeaderElection(FlakyLease(lease_seconds=10), on_elected=scheduler.start, on_demoted=scheduler.stop)
+
+    async def run():
+        await leader.check()
+        await asyncio.wait_for(started.wait(), timeout=5)
+        await leader.resign()
+        await scheduler.wait_stopped()
+
+    asyncio.run(run())
+    assert events == ["cancelled"]
+    assert not scheduler.running
+
+
+class HeldElsewhere(LeaderLock):
+    """Lock some other process holds."""
+
+    async def acquire(self) -> bool:
+        return False
+
+    async def release(self) -> None:
+        pass
+
+
+def test_worker_once_skips_while_another_process_leads(monkeypatch):
+    import worker
+
+    ran = []
+
+    async def job():
+        ran.append("job")
+
+    for name in ("sync_race_data", "update_odds_data", "sync_f1_standings_to_storage"):
+        monkeypatch.setattr(worker, name, job)
+
+    monkeypatch.setattr(worker.leader_election, "lock", HeldElsewhere())
+    asyncio.run(worker.run_once())
+    assert ran == []
+
+    monkeypatch.setattr(worker.leader_election, "lock", FlakyLease(lease_seconds=60))
+    asyncio.run(worker.run_once())
+    assert ran == ["job", "job", "job"]
@@ -0,0 +1,54 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+from metrics import JOB_RUNS, record_job_error, track_job
+
+
+def job_runs(name: str, status: str) -> float:
+    return JOB_RUNS.labels(name, status)._value.get()
+
+
+def test_track_job_counts_swallowed_errors():
+    @track_job("test-swallowed")
+    async def job():
+        try:
+            raise RuntimeError("source down")
+        except RuntimeError:
+            record_job_error()
+
+    asyncio.run(job())
+    assert job_runs("test-swallowed", "error") == 1
+    assert job_runs("test-swallowed", "success") == 0
+
+
+def test_track_job_counts_success_and_raised_errors():
+    @track_job("test-raised")
+    async def job(fail: bool):
+        if fail:
+            raise RuntimeError("boom")
+
+    asyncio.run(job(False))
+    try:
+        asyncio.run(job(True))
+    except RuntimeError:
+        pass
+    assert job_runs("test-raised", "success") == 1
+    assert job_runs("test-raised", "error") == 1
+
+
+def test_empty_multiproc_dir_means_single_process(tmp_path):
+    """An empty PROMETHEUS_MULTIPROC_DIR (as a bare .env line loads it) doesn't turn on multiprocess mode."""
+    code = (
+        "import metrics\n"
+        "from prometheus_client import values\n"
+        "assert not metrics.MULTIPROCESS\n"
+        "assert values.ValueClass is values.MutexValue\n"
+        "metrics.record_cache('page', True)\n"
+        "assert b'racecentral_cache_requests_total' in metrics.render_metrics()[0]\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": "", "PYTHONPATH": root}
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+from race_index import RaceIndex
+
+
+def race(day: int, series: str = "F1", month: int = 3) -> dict:
+    return {
+        "RowKey": f"2026{month:02d}{day:02d}1300_{series}_R{day}",
+        "Series": series,
+        "RaceName": f"{series} race {month}/{day}",
+        "StartTime": f"2026-{month:02d}-{day:02d}T13:00:00Z",
+    }
+
+
+EVENTS = [race(8), race(1), race(15, "NASCAR"), race(22), race(5, "NASCAR", month=4), {"RowKey": "bad", "StartTime": "TBD"}]
+
+
+def at(month: int, day: int, hour: int = 12) -> datetime:
+    return datetime(2026, month, day, hour, tzinfo=timezone.utc)
+
+
+def names(races: list[dict]) -> list[str]:
+    return [r["RaceName"] for r in races]
+
+
+def test_index_sorts_by_start_and_drops_unparseable_times():
+    index = RaceIndex(EVENTS)
+    assert len(index) == 5
+    assert [r["start"].day for r in index.all()] == [1, 8, 15, 22, 5]
+    assert names(index.all("f1")) == ["F1 race 3/1", "F1 race 3/8", "F1 race 3/22"]
+
+
+def test_between_excludes_start_and_includes_end():
+    index = RaceIndex(EVENTS)
+    assert names(index.between(at(3, 1, 13), at(3, 15, 13))) == ["F1 race 3/8", "NASCAR race 3/15"]
+    assert names(index.upcoming(at(3, 10), at(3, 30), series="NASCAR")) == ["NASCAR race 3/15"]
+
+
+def test_past_is_most_recent_first_and_limited():
+    index = RaceIndex(EVENTS)
+    assert names(index.past(at(3, 20), limit=2)) == ["NASCAR race 3/15", "F1 race 3/8"]
+    assert names(index.past(at(3, 20), series="F1")) == ["F1 race 3/8", "F1 race 3/1"]
+    assert index.past(at(2, 1)) == []
+
+
+def test_past_before_cursor_pages_backwards():
+    index = RaceIndex(EVENTS)
+    first = index.past(at(4, 30), limit=2)
+    assert names(first) == ["NASCAR race 4/5", "F1 race 3/22"]
+    second = index.past(at(4, 30), limit=2, before=first[-1]["RowKey"])
+    assert names(second) == ["NASCAR race 3/15", "F1 race 3/8"]
+
+
+def test_past_before_a_removed_race_falls_back_to_its_rowkey_time():
+    """A cursor race dropped by a sync still pages from where it was."""
+    index = RaceIndex([e for e in EVENTS if e.get("RowKey") != race(15, "NASCAR")["RowKey"]])
+    older = index.past(at(4, 30), before=race(15, "NASCAR")["RowKey"])
+    assert names(older) == ["F1 race 3/8", "F1 race 3/1"]
+    assert index.past(at(4, 30), series="NASCAR", before=race(15, "NASCAR")["RowKey"]) == []
+
+
+def test_season_months_and_next_start():
+    index = RaceIndex(EVENTS)
+    assert len(index.season(2026)) == 5
+    assert index.season(2025) == []
+    assert names(index.season(2026, "nascar")) == ["NASCAR race 3/15", "NASCAR race 4/5"]
+    assert [m["key"] for m in index.months(2026)] == ["2026-03", "2026-04"]
+    assert [m["key"] for m in index.months(series="F1")] == ["2026-03"]
+    assert index.months(series="IndyCar") == []
+    assert index.next_start(at(3, 16)) == at(3, 22, 13)
+    assert index.next_start(at(5, 1)) is None
@@ -0,0 +1,69 @@
+import gzip
+
+from response_cache import ResponseCache, choose_encoding, etag_matches, make_etag, not_modified_since
+
+
+def test_entries_expire_after_the_ttl():
+    cache = ResponseCache(ttl_seconds=60)
+    entry = cache.put("home", b"<html>", "text/html")
+
+    entry.created_at -= 59
+    assert cache.get("home") is entry
+    entry.created_at -= 2
+    assert cache.get("home") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", b"a", "text/html")
+    cache.put("b", b"b", "text/html")
+    cache.get("a")
+    cache.put("c", b"c", "text/html")
+
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"a"
+    assert cache.get("c").body == b"c"
+
+
+def test_etag_follows_the_body():
+    cache = ResponseCache()
+    first = cache.put("page", b"v1", "text/html")
+    assert first.etag == make_etag(b"v1")
+    assert cache.put("page", b"v1", "text/html").etag == first.etag
+    assert cache.put("page", b"v2", "text/html").etag != first.etag
+
+
+def test_each_encoding_has_its_own_etag_and_body_is_compressed_once():
+    entry = ResponseCache().put("page", b"x" * 1000, "text/html")
+    gzip_etag = entry.encoded_etag("gzip")
+
+    assert entry.encoded_etag(None) == entry.etag
+    assert gzip_etag != entry.etag and gzip_etag != entry.encoded_etag("br")
+    assert gzip_etag.startswith('"') and gzip_etag.endswith('-gzip"')
+
+    body = entry.encoded_body("gzip")
+    assert gzip.decompress(body) == entry.body
+    assert entry.encoded_body("gzip") is body
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"zzz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abc-gzip"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_choose_encoding_prefers_br_and_honours_q0():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip, br;q=0") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding(None) is None
+
+
+def test_not_modified_since_compares_http_dates():
+    last_modified = "Sun, 01 Mar 2026 13:00:00 GMT"
+    assert not_modified_since("Sun, 01 Mar 2026 13:00:00 GMT", last_modified)
+    assert not not_modified_since("Sun, 01 Mar 2026 12:59:59 GMT", last_modified)
+    assert not not_modified_since("garbage", last_modified)
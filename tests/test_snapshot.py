@@ -0,0 +1,53 @@
+import asyncio
+import gzip
+import json
+
+from snapshot import SNAPSHOT_FORMAT, load_snapshot, read_snapshot, save_snapshot, write_snapshot
+
+EVENTS = [{"PartitionKey": "F1_2026", "RowKey": "202603081300_F1_AUS", "RaceName": "Australian Grand Prix"}]
+STANDINGS = {"drivers": [{"name": "Lando Norris", "points": 25}]}
+NEWS = [{"title": "Season opener", "source": "BBC"}]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "data" / "snapshot.json.gz")
+    write_snapshot(path, EVENTS, STANDINGS, NEWS)
+
+    data = read_snapshot(path)
+    assert data["format"] == SNAPSHOT_FORMAT
+    assert (data["events"], data["standings"], data["news"]) == (EVENTS, STANDINGS, NEWS)
+    assert data["saved_at"]
+
+
+def test_rewrite_replaces_the_snapshot_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / "snapshot.json.gz")
+    write_snapshot(path, EVENTS, STANDINGS, NEWS)
+    write_snapshot(path, [], STANDINGS, NEWS)
+
+    assert read_snapshot(path)["events"] == []
+    assert [p.name for p in tmp_path.iterdir()] == ["snapshot.json.gz"]
+
+
+def test_overlapping_saves_leave_a_readable_snapshot(tmp_path):
+    path = str(tmp_path / "snapshot.json.gz")
+    many = EVENTS * 2000
+
+    async def run():
+        results = await asyncio.gather(*(save_snapshot(path, many, STANDINGS, NEWS) for _ in range(4)))
+        return results, await load_snapshot(path)
+
+    results, data = asyncio.run(run())
+    assert all(results)
+    assert len(data["events"]) == len(many)
+
+
+def test_missing_corrupt_or_old_snapshots_read_as_none(tmp_path):
+    assert read_snapshot(str(tmp_path / "missing.json.gz")) is None
+
+    corrupt = tmp_path / "corrupt.json.gz"
+    corrupt.write_bytes(b"not gzip")
+    assert read_snapshot(str(corrupt)) is None
+
+    old = tmp_path / "old.json.gz"
+    old.write_bytes(gzip.compress(json.dumps({"format": SNAPSHOT_FORMAT - 1, "events": []}).encode()))
+    assert read_snapshot(str(old)) is None
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from storage_pipeline import StorageWritePipeline
+
+
+def test_write_raising_cancelled_keeps_the_worker():
+    """A write that raises CancelledError fails alone; later writes still run."""
+    pipeline = StorageWritePipeline(concurrency=1, queue_size=1)
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    async def ok():
+        return "ok"
+
+    async def run():
+        with pytest.raises(asyncio.CancelledError):
+            await pipeline.submit(cancelled, label="upsert")
+        result = await asyncio.wait_for(pipeline.submit(ok, label="upsert"), timeout=1)
+        alive = [worker for worker in pipeline._workers if not worker.done()]
+        await pipeline.close()
+        return result, len(alive)
+
+    assert asyncio.run(run()) == ("ok", 1)
+    assert pipeline.stats["upsert"]["count"] == 2
+    assert pipeline.stats["upsert"]["errors"] == 1
+
+
+def test_failed_write_raises_to_its_submitter_only():
+    pipeline = StorageWritePipeline(concurrency=2)
+
+    async def fail():
+        raise ValueError("conflict")
+
+    async def ok():
+        return 1
+
+    async def run():
+        results = await asyncio.gather(
+            pipeline.submit(fail, label="transaction"),
+            pipeline.submit(ok, label="transaction"),
+            return_exceptions=True,
+        )
+        await pipeline.close()
+        return results
+
+    failed, succeeded = asyncio.run(run())
+    assert isinstance(failed, ValueError)
+    assert succeeded == 1
+    assert pipeline.stats["transaction"]["errors"] == 1
+
+
+def test_concurrency_is_bounded_and_full_queue_blocks_submit():
+    pipeline = StorageWritePipeline(concurrency=2, queue_size=1)
+    state = {"running": 0, "peak": 0}
+
+    async def run():
+        gate = asyncio.Event()
+
+        async def write():
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await gate.wait()
+            state["running"] -= 1
+
+        # Two writes in flight, one waiting in the queue - the fourth submit must block
+        submits = [asyncio.create_task(pipeline.submit(write)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        blocked = asyncio.create_task(pipeline.submit(write))
+        await asyncio.sleep(0.01)
+        queue_full = pipeline._queue.full() and not blocked.done()
+
+        gate.set()
+        await asyncio.gather(*submits, blocked)
+        await pipeline.close()
+        return queue_full
+
+    assert asyncio.run(run())
+    assert state["peak"] == 2
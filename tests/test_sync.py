@@ -0,0 +1,151 @@
+import asyncio
+
+
+async def no_f1_schedule(year: int = 2025) -> list[dict]:
+    return []
+
+
+def test_schedule_sync_keeps_polled_results(app, monkeypatch):
+    """A podium written by the results poll survives the next schedule sync."""
+    podium = [{"full_name": "Lando Norris"}, {"full_name": "Oscar Piastri"}, {"full_name": "Max Verstappen"}]
+
+    async def fake_openf1(year, location, client=None):
+        return {"winner": podium[0]["full_name"], "podium": podium}
+
+    monkeypatch.setattr(app, "fetch_f1_schedule", no_f1_schedule)
+    monkeypatch.setattr(app, "fetch_openf1_race_results", fake_openf1)
+
+    async def run():
+        await app.sync_race_data()
+        # A static-schedule F1 race - no RoundNumber, so nothing rebuilds its podium
+        events = await app.race_store.get(app.load_race_events)
+        race = next(e for e in events if e["Series"] == "F1" and not e.get("RoundNumber") and not e.get("Winner"))
+
+        assert await app.update_race_result(race["RowKey"])
+        await app.sync_race_data()
+
+        storage = await app.get_storage()
+        return await storage.get_entity(race["PartitionKey"], race["RowKey"])
+
+    stored = asyncio.run(run())
+    assert stored["Winner"] == "Lando Norris"
+    assert stored["Podium2"] == "Oscar Piastri"
+    assert stored["Podium3"] == "Max Verstappen"
+
+
+def test_failed_f1_fetch_keeps_stored_season(app, monkeypatch):
+    """An empty FastF1 schedule (its error result) must not delete the stored F1 2025 races."""
+    async def f1_schedule(year: int = 2025) -> list[dict]:
+        return [
+            {"name": f"Grand Prix {n}", "circuit": "Monza", "country": "Italy",
+             "date": f"2025-0{n}-07T13:00:00Z", "round": n}
+            for n in range(1, 4)
+        ]
+
+    async def no_podiums(storage, year, f1_races):
+        return {}
+
+    monkeypatch.setattr(app, "fetch_completed_f1_podiums", no_podiums)
+
+    async def run():
+        monkeypatch.setattr(app, "fetch_f1_schedule", f1_schedule)
+        await app.sync_race_data()
+        monkeypatch.setattr(app, "fetch_f1_schedule", no_f1_schedule)
+        await app.sync_race_data()
+        storage = await app.get_storage()
+        return await storage.query_entities("F1_2025")
+
+    stored = asyncio.run(run())
+    assert {entity["RaceName"] for entity in stored} >= {"Grand Prix 1", "Grand Prix 2", "Grand Prix 3"}
+
+
+# Shaped like the OpenF1 /sessions, /drivers and /position responses
+OPENF1_SESSIONS = [
+    {"session_key": 9693, "session_name": "Race", "session_type": "Race", "location": "Melbourne",
+     "country_name": "Australia", "circuit_short_name": "Melbourne", "year": 2026},
+    {"session_key": 9712, "session_name": "Race", "session_type": "Race", "location": "Monza",
+     "country_name": "Italy", "circuit_short_name": "Monza", "year": 2026},
+]
+OPENF1_DRIVERS = [
+    {"driver_number": 4, "first_name": "Lando", "last_name": "Norris", "name_acronym": "NOR", "team_name": "McLaren"},
+    {"driver_number": 81, "first_name": "Oscar", "last_name": "Piastri", "name_acronym": "PIA", "team_name": "McLaren"},
+    {"driver_number": 1, "first_name": "Max", "last_name": "Verstappen", "name_acronym": "VER", "team_name": "Red Bull Racing"},
+]
+OPENF1_POSITIONS = [
+    {"driver_number": 1, "position": 1, "session_key": 9693},
+    {"driver_number": 4, "position": 2, "session_key": 9693},
+    {"driver_number": 81, "position": 3, "session_key": 9693},
+    {"driver_number": 4, "position": 1, "session_key": 9693},
+    {"driver_number": 1, "position": 3, "session_key": 9693},
+    {"driver_number": 81, "position": 2, "session_key": 9693},
+]
+
+
+class FakeOpenF1Client:
+    """Stands in for httpx.AsyncClient, answering the three OpenF1 endpoints."""
+
+    def __init__(self, *args, **kwargs):
+        self.session_keys = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, url, timeout=None):
+        class Resp:
+            def __init__(self, data):
+                self._data = data
+
+            def json(self):
+                return self._data
+
+        if "/sessions" in url:
+            return Resp(OPENF1_SESSIONS)
+        self.session_keys.append(int(url.rsplit("=", 1)[1]))
+        if "/drivers" in url:
+            return Resp(OPENF1_DRIVERS)
+        return Resp(OPENF1_POSITIONS)
+
+
+def test_static_race_results_match_openf1_sessions(app, monkeypatch):
+    """A static-schedule race is found on OpenF1 by its location, not its full circuit name."""
+    client = FakeOpenF1Client()
+    monkeypatch.setattr(app, "fetch_f1_schedule", no_f1_schedule)
+    monkeypatch.setattr(app.httpx, "AsyncClient", lambda *args, **kwargs: client)
+
+    async def run():
+        await app.sync_race_data()
+        events = await app.race_store.get(app.load_race_events)
+        race = next(e for e in events if e["RaceName"] == "Australian Grand Prix" and e["StartTime"].startswith("2026"))
+        assert race["Venue"] == "Albert Park Circuit"
+
+        assert await app.update_race_result(race["RowKey"])
+        storage = await app.get_storage()
+        return await storage.get_entity(race["PartitionKey"], race["RowKey"])
+
+    stored = asyncio.run(run())
+    assert client.session_keys == [9693, 9693]
+    assert stored["Winner"] == "Lando Norris"
+    assert stored["Podium2"] == "Oscar Piastri"
+    assert stored["Podium3"] == "Max Verstappen"
+
+
+def test_transaction_batches_split_at_100_per_partition(app):
+    ops = [("upsert", {"PartitionKey": "F1_2026", "RowKey": f"r{n:03d}"}) for n in range(250)]
+    ops += [("delete", {"PartitionKey": "NASCAR_2026", "RowKey": "x"})]
+
+    batches = app.build_transaction_batches(ops)
+
+    assert [len(batch) for batch in batches] == [100, 100, 50, 1]
+    for batch in batches:
+        assert len({op[1]["PartitionKey"] for op in batch}) == 1
+    assert [op[1]["RowKey"] for batch in batches[:3] for op in batch] == [f"r{n:03d}" for n in range(250)]
+
+
+def test_transaction_batches_keep_the_last_operation_per_row(app):
+    entity = {"PartitionKey": "F1_2026", "RowKey": "r1"}
+    ops = [("upsert", entity), ("upsert", {"PartitionKey": "F1_2026", "RowKey": "r2"}), ("delete", entity)]
+
+    assert app.build_transaction_batches(ops) == [[("delete", entity), ops[1]]]
@@ -4,7 +4,7 @@ Contains hardcoded track coordinates, networks, and helper functions.
 """
 
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime
 
 # =============================================================================
 # TRACK DATA ENRICHMENT DICTIONARY
@@ -547,55 +547,21 @@ def get_series_color(series: str) -> str:
     return colors.get(series, "#6B7280")
 
 
-def format_race_time(iso_time: str) -> dict:
+def format_start_time(dt: datetime) -> dict:
     """
-    Format ISO time string to human-readable format.
+    Clock-independent display strings for a race start time.
 
     Returns dict with:
         - date: "Sun, Mar 2"
-        - time: "2:00 PM EST"
-        - countdown: "in 3 days" or "LIVE" or "Completed"
+        - time: "2:00 PM UTC"
+        - timestamp / iso: for client-side local time and countdown
     """
-    try:
-        dt = datetime.fromisoformat(iso_time.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-
-        # Format date and time
-        date_str = dt.strftime("%a, %b %d")
-        time_str = dt.strftime("%I:%M %p UTC")
-
-        # Calculate countdown
-        diff = dt - now
-        if diff.total_seconds() < 0:
-            # Race has started or completed
-            if diff.total_seconds() > -7200:  # Within 2 hours
-                countdown = "LIVE"
-            else:
-                countdown = "Completed"
-        elif diff.days > 0:
-            countdown = f"in {diff.days} day{'s' if diff.days != 1 else ''}"
-        elif diff.seconds > 3600:
-            hours = diff.seconds // 3600
-            countdown = f"in {hours} hour{'s' if hours != 1 else ''}"
-        else:
-            minutes = diff.seconds // 60
-            countdown = f"in {minutes} min"
-
-        return {
-            "date": date_str,
-            "time": time_str,
-            "countdown": countdown,
-            "timestamp": dt.timestamp(),
-            "iso": dt.isoformat()
-        }
-    except Exception:
-        return {
-            "date": "TBD",
-            "time": "TBD",
-            "countdown": "TBD",
-            "timestamp": 0,
-            "iso": ""
-        }
+    return {
+        "date": dt.strftime("%a, %b %d"),
+        "time": dt.strftime("%I:%M %p UTC"),
+        "timestamp": dt.timestamp(),
+        "iso": dt.isoformat()
+    }
 
 
 def generate_row_key(start_time: str, series: str, race_id: str) -> str:
@@ -615,6 +581,30 @@ def generate_row_key(start_time: str, series: str, race_id: str) -> str:
     return f"{timestamp}_{series}_{safe_race_id}"
 
 
+def generate_partition_key(series: str, start_time: str) -> str:
+    """
+    Generate a PartitionKey for Azure Table Storage.
+    Format: {Series}_{Season}, so one series' season lives in one partition.
+    """
+    try:
+        season = datetime.fromisoformat(start_time.replace('Z', '+00:00')).year
+    except Exception:
+        season = 0
+
+    return f"{series}_{season}"
+
+
+def row_key_range(start: Optional[datetime] = None, end: Optional[datetime] = None) -> tuple[str, str]:
+    """
+    Get the (lower, upper) RowKey bounds covering races between start and end.
+    RowKeys begin with a %Y%m%d%H%M timestamp, so a time window is a key range.
+    """
+    lower = start.strftime("%Y%m%d%H%M") if start else ""
+    # "~" sorts after "_" and any alphanumeric, so every race in the end minute is included
+    upper = f"{end.strftime('%Y%m%d%H%M')}~" if end else "~"
+    return lower, upper
+
+
 # RSS Feed URLs for motorsport news
 RSS_FEEDS = {
     "motorsport": "https://www.motorsport.com/rss/all/news/",
@@ -0,0 +1,124 @@
+"""
+RaceCentral 2.0 - Background Worker
+Runs the schedule sync, odds scraping (Chromium), FastF1 results and
+standings jobs in their own process, so their memory and CPU spikes stay
+out of the web workers. Run the web app with RUN_BACKGROUND_JOBS=false
+alongside it; the web workers pick up new data from the worker's data
+version announcements.
+
+Usage:
+    python -m worker          # run the job scheduler until stopped
+    python -m worker --once   # one sync, odds and standings pass, then exit
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from leader import LeaderElection
+from main import (
+    close_storage,
+    init_storage,
+    leader_election,
+    race_scheduler,
+    restore_race_snapshot,
+    sync_f1_standings_to_storage,
+    sync_race_data,
+    update_odds_data,
+    write_pipeline,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_jobs() -> None:
+    """The sync, odds and standings jobs once each, in order."""
+    for name, job in (
+        ("Data sync", sync_race_data),
+        ("Odds update", update_odds_data),
+        ("F1 standings sync", sync_f1_standings_to_storage),
+    ):
+        try:
+            await job()
+        except Exception as e:
+            logger.error(f"{name} error: {e}")
+
+
+async def run_once() -> None:
+    """
+    One pass of every job, for cron-style deployments. The pass holds the
+    configured leader lock, so it never overlaps a running leader or another
+    cron pass; it is skipped if someone else holds the lock, and cut short
+    if the lock is lost partway through.
+    """
+    running: dict[str, asyncio.Task] = {}
+    election = LeaderElection(
+        leader_election.lock,
+        on_elected=lambda: None,
+        on_demoted=lambda: running["jobs"].cancel() if "jobs" in running else None,
+        interval_seconds=leader_election.interval_seconds,
+    )
+    if not await election.check():
+        logger.info("Another process holds the leader lock - skipping this pass")
+        return
+
+    jobs = running["jobs"] = asyncio.create_task(run_jobs())
+    renewal = asyncio.create_task(election.run())
+    try:
+        await asyncio.wait({jobs})
+    finally:
+        renewal.cancel()
+        try:
+            await renewal
+        except asyncio.CancelledError:
+            pass
+        jobs.cancel()
+        await asyncio.gather(jobs, return_exceptions=True)
+        await election.resign()
+    if jobs.cancelled():
+        logger.warning("Lost the leader lock - stopped this pass early")
+
+
+async def run_scheduler() -> None:
+    """
+    Run the job scheduler until SIGINT/SIGTERM. Worker replicas still elect
+    a leader, so only one of them runs the jobs at a time.
+    """
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    election = asyncio.create_task(leader_election.run())
+    logger.info("Worker started")
+    await stop.wait()
+
+    election.cancel()
+    try:
+        await election
+    except asyncio.CancelledError:
+        pass
+    await leader_election.resign()
+    await race_scheduler.wait_stopped()
+    logger.info("Worker stopped")
+
+
+async def main(args: argparse.Namespace) -> None:
+    # The snapshot gives the results and odds planning a race index right away
+    await restore_race_snapshot()
+    await init_storage()
+    try:
+        if args.once:
+            await run_once()
+        else:
+            await run_scheduler()
+    finally:
+        await write_pipeline.close()
+        await close_storage()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the RaceCentral background jobs")
+    parser.add_argument("--once", action="store_true", help="run every job once and exit")
+    asyncio.run(main(parser.parse_args()))